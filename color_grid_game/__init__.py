@@ -17,7 +17,10 @@ from itertools import repeat
 
 # modules
 from .grid import Grid
+from .pair_set import PairSet
+from .legal_moves import LegalMoves
 from .minimax_bot import Minimax_Bot
 from .mcts_bot import MCTS_Bot
 from .solver import Solver
 from .solvers import *
+from .solution_cache import SolutionCache
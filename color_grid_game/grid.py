@@ -22,9 +22,38 @@ class Grid:
         Lines are numbered from 0 to n-1, and columns from 0 to m-1.
     colors_list : list[str]
         The mapping between the value of `color[i][j]` and the corresponding color.
+    backend : str
+        The storage used for `color` and `value`: "list" (nested Python lists) or
+        "numpy" (contiguous arrays, int8 colors and int32 values).
+    paired_by : dict[tuple[int, int], int]
+        The cells blocked with `block_cell`, mapped to the player who paired them
+        (0 when no player is specified).
+    moves : list
+        The moves played with `make_move` and not taken back, each stored as the pair
+        and the colors its cells had before.
+    zobrist : int
+        The 64-bit Zobrist hash of the state: the XOR of the keys of each (cell, color)
+        and each (cell, paired-by player). It is computed on first access, then updated
+        in O(1) by `block_cell`; direct writes to `color` require a call to `rehash`.
     """
 
-    def __init__(self, n: int, m: int, color: list[list[int]] = None, value: list[list[int]] = None):
+    backends = ("list", "numpy")
+
+    # Zobrist keys per grid shape, see zobrist_keys
+    _zobrist_tables = {}
+    zobrist_seed = 0x5EED
+
+    # compatible[c1, c2] is True when colors c1 and c2 may be paired (black never pairs)
+    compatible = np.array([
+        [True, True, True, True, False],     # white can pair with all except black
+        [True, True, True, False, False],    # red can pair with white, blue, red
+        [True, True, True, False, False],    # blue can pair with white, blue, red
+        [True, False, False, True, False],   # green can pair with white, green
+        [False, False, False, False, False]  # black cannot be paired
+    ])
+
+    def __init__(self, n: int, m: int, color: list[list[int]] = None, value: list[list[int]] = None,
+                 backend: str = "list"):
         """
         Initializes the grid.
 
@@ -38,24 +67,36 @@ class Grid:
             The grid cells colors. Default is empty, which initializes each cell with color 0 (white).
         value : list[list[int]], optional
             The grid cells values. Default is empty, which initializes each cell with value 1.
+        backend : str, optional
+            "list" (default) keeps `color` and `value` as nested lists, "numpy" stores them
+            as NumPy arrays and enables the vectorized code paths.
 
         Raises
         ------
         ValueError
-            If `n` or `m` is not a positive integer.
+            If `n` or `m` is not a positive integer, or if `backend` is not recognized.
         """
         if n <= 0 or m <= 0:
             raise ValueError("Number of rows and columns must be positive integers.")
+        if backend not in Grid.backends:
+            raise ValueError("Unrecognized backend parameter.")
 
         self.n = n
         self.m = m
+        self.backend = backend
         if color is None or len(color) == 0:
             color = [[0 for _ in range(m)] for _ in range(n)]
-        self.color = color
         if value is None or len(value) == 0:
             value = [[1 for _ in range(m)] for _ in range(n)]
+        if backend == "numpy":
+            color = np.array(color, dtype=np.int8)
+            value = np.array(value, dtype=np.int32)
+        self.color = color
         self.value = value
         self.colors_list = ['w', 'r', 'b', 'g', 'k']
+        self.paired_by = {}
+        self.moves = []
+        self._zobrist = None
 
     def _is_within_bounds(self, i: int, j: int) -> bool:
         """
@@ -89,7 +130,7 @@ class Grid:
             output += f"{[self.colors_list[self.color[i][j]] for j in range(self.m)]}\n"
         output += "and the following values:\n"
         for i in range(self.n):
-            output += f"{self.value[i]}\n"
+            output += f"{[int(v) for v in self.value[i]]}\n"
         return output
 
     def __repr__(self) -> str:
@@ -106,6 +147,22 @@ class Grid:
         """
         return f"<grid.Grid: n={self.n}, m={self.m}>"
 
+    def to_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the colors and values of the grid as NumPy arrays.
+
+        With the "numpy" backend the stored arrays are returned without copy,
+        otherwise they are built from the nested lists.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The (n, m) int8 color array and the (n, m) int32 value array.
+        """
+        if self.backend == "numpy":
+            return self.color, self.value
+        return np.array(self.color, dtype=np.int8), np.array(self.value, dtype=np.int32)
+
     def plot(self) -> None:
         """
         Plots a visual representation of the grid using matplotlib.
@@ -151,6 +208,171 @@ class Grid:
             raise IndexError("Cell index out of grid boundaries.")
         return self.color[i][j] == 4
 
+    @classmethod
+    def zobrist_keys(cls, n: int, m: int) -> list[list[int]]:
+        """
+        Returns the Zobrist keys of a grid shape.
+
+        The keys are drawn once per shape from a fixed seed, so that the hashes agree
+        across grids, runs and processes.
+
+        Parameters
+        ----------
+        n : int
+            Number of rows in the grid.
+        m : int
+            Number of columns in the grid.
+
+        Returns
+        -------
+        list[list[int]]
+            For each cell id i*m + j, 8 random 64-bit keys: indices 0 to 4 for its color,
+            5 to 7 for the player (0, 1 or 2) who paired it.
+        """
+        keys = cls._zobrist_tables.get((n, m))
+        if keys is None:
+            rng = np.random.default_rng([cls.zobrist_seed, n, m])
+            keys = rng.integers(0, 2**64, size=(n * m, 8), dtype=np.uint64).tolist()
+            cls._zobrist_tables[(n, m)] = keys
+        return keys
+
+    def rehash(self) -> int:
+        """
+        Recomputes the Zobrist hash of the grid from scratch.
+
+        Returns
+        -------
+        int
+            The Zobrist hash, also stored in self.zobrist.
+
+        Complexity : O(n*m)
+        """
+        keys = self.zobrist_keys(self.n, self.m)
+        h = 0
+        for i in range(self.n):
+            row = self.color[i]
+            for j in range(self.m):
+                h ^= keys[i * self.m + j][row[j]]
+        for (i, j), player in self.paired_by.items():
+            h ^= keys[i * self.m + j][5 + player]
+        self._zobrist = h
+        return h
+
+    @property
+    def zobrist(self) -> int:
+        """
+        The Zobrist hash of the grid, computed on first access.
+        """
+        if self._zobrist is None:
+            self.rehash()
+        return self._zobrist
+
+    def block_cell(self, i: int, j: int, player: int = 0) -> None:
+        """
+        Blocks a cell (colors it black) after it was paired, updating the Zobrist hash.
+
+        Parameters
+        ----------
+        i : int
+            Row index of the cell.
+        j : int
+            Column index of the cell.
+        player : int, optional
+            The player (1 or 2) who paired the cell. Default is 0 (unspecified).
+
+        Raises
+        ------
+        ValueError
+            If the cell was already blocked with `block_cell`.
+
+        Complexity : O(1)
+        """
+        if (i, j) in self.paired_by:
+            raise ValueError("Cell already blocked.")
+        if self._zobrist is not None:
+            key = self.zobrist_keys(self.n, self.m)[i * self.m + j]
+            self._zobrist ^= key[self.color[i][j]] ^ key[4] ^ key[5 + player]
+        self.color[i][j] = 4
+        self.paired_by[(i, j)] = player
+
+    def unblock_cell(self, i: int, j: int, color: int) -> None:
+        """
+        Restores the color of a cell blocked with `block_cell`, updating the Zobrist hash.
+
+        Parameters
+        ----------
+        i : int
+            Row index of the cell.
+        j : int
+            Column index of the cell.
+        color : int
+            The color of the cell before it was blocked.
+
+        Raises
+        ------
+        ValueError
+            If the cell was not blocked with `block_cell`.
+
+        Complexity : O(1)
+        """
+        if (i, j) not in self.paired_by:
+            raise ValueError("Cell not blocked.")
+        player = self.paired_by.pop((i, j))
+        if self._zobrist is not None:
+            key = self.zobrist_keys(self.n, self.m)[i * self.m + j]
+            self._zobrist ^= key[4] ^ key[5 + player] ^ key[color]
+        self.color[i][j] = color
+
+    def make_move(self, pair: tuple[tuple[int, int], tuple[int, int]], player: int = 0) -> None:
+        """
+        Plays a pair in place: both cells are blocked, and their colors are kept so that
+        `unmake_move` can restore them. Nothing is allocated besides the undo record,
+        so the bots can explore candidate moves without copying the grid.
+
+        Parameters
+        ----------
+        pair : tuple[tuple[int, int], tuple[int, int]]
+            The pair of cells played.
+        player : int, optional
+            The player (1 or 2) who plays the pair. Default is 0 (unspecified).
+
+        Raises
+        ------
+        ValueError
+            If one of the cells is already blocked by a move.
+
+        Complexity : O(1)
+        """
+        (i1, j1), (i2, j2) = pair
+        if (i2, j2) in self.paired_by:
+            raise ValueError("Cell already blocked.")
+        colors = (self.color[i1][j1], self.color[i2][j2])
+        self.block_cell(i1, j1, player)
+        self.block_cell(i2, j2, player)
+        self.moves.append((pair, colors))
+
+    def unmake_move(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        Takes back the last move played with `make_move`.
+
+        Returns
+        -------
+        tuple[tuple[int, int], tuple[int, int]]
+            The pair taken back.
+
+        Raises
+        ------
+        IndexError
+            If no move is left to take back.
+
+        Complexity : O(1)
+        """
+        pair, (color1, color2) = self.moves.pop()
+        (i1, j1), (i2, j2) = pair
+        self.unblock_cell(i2, j2, color2)
+        self.unblock_cell(i1, j1, color1)
+        return pair
+
     def cost(self, pair: tuple[tuple[int, int], tuple[int, int]]) -> int:
         """
         Returns the cost of a pair of cells.
@@ -173,7 +395,35 @@ class Grid:
         (i1, j1), (i2, j2) = pair
         if not (self._is_within_bounds(i1, j1) and self._is_within_bounds(i2, j2)):
             raise ValueError("Pair contains invalid cell indices.")
-        return abs(self.value[i1][j1] - self.value[i2][j2])
+        return int(abs(self.value[i1][j1] - self.value[i2][j2]))
+
+    def costs(self, pairs) -> np.ndarray:
+        """
+        Returns the costs of several pairs of cells at once.
+
+        Parameters
+        ----------
+        pairs : list[tuple[tuple[int, int], tuple[int, int]]] or np.ndarray
+            The pairs of cells, as a list in the format ((i1, j1), (i2, j2))
+            or as an integer array of shape (P, 2, 2).
+
+        Returns
+        -------
+        np.ndarray
+            An int64 array of length P with the cost of each pair.
+
+        Raises
+        ------
+        ValueError
+            If a pair contains invalid cell indices.
+        """
+        cells = np.asarray(pairs, dtype=np.int64).reshape(-1, 2, 2)
+        rows, cols = cells[:, :, 0], cells[:, :, 1]
+        if np.any((rows < 0) | (rows >= self.n) | (cols < 0) | (cols >= self.m)):
+            raise ValueError("Pair contains invalid cell indices.")
+        _, value = self.to_arrays()
+        value = value.astype(np.int64)
+        return np.abs(value[rows[:, 0], cols[:, 0]] - value[rows[:, 1], cols[:, 1]])
 
     def all_pairs(self, rules="original rules") -> list[tuple[tuple[int, int], tuple[int, int]]]:
         """
@@ -197,6 +447,9 @@ class Grid:
         if rules not in ["original rules", "new rules"]:
             raise ValueError("Unrecognized rules parameter.")
 
+        if self.backend == "numpy":
+            return self._all_pairs_numpy(rules)
+
         res = []
         allowed = {
             0: {0, 1, 2, 3},  # white can pair with all except black
@@ -245,6 +498,127 @@ class Grid:
                                     res.append(((i, j), (k, l)))
             return sorted(res)
 
+    def _all_pairs_numpy(self, rules: str) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Vectorized version of `all_pairs`, built from the edge list returned by `edges`.
+
+        The returned list is identical to the one of the list-based implementation.
+
+        Parameters
+        ----------
+        rules : str
+            The rules to apply for determining allowed pairs.
+
+        Returns
+        -------
+        list[tuple[tuple[int, int], tuple[int, int]]]
+            The sorted list of allowed pairs.
+        """
+        src, dst, _ = self.edges(rules)
+        return list(zip(self.cells(src), self.cells(dst)))
+
+    def edges(self, rules: str = "original rules") -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns all allowed pairs as flat integer arrays.
+
+        Cells are identified by their id `i * m + j`. The k-th allowed pair is
+        (`src[k]`, `dst[k]`) and costs `cost[k]`. The pairs are the ones returned by
+        `all_pairs`, in the same order, but no tuple is built: the arrays come from
+        boolean masks over the horizontal and vertical neighbour shifts and the
+        color compatibility table.
+
+        Parameters
+        ----------
+        rules : str, optional
+            The rules to apply for determining allowed pairs. Default is "original rules".
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The int64 arrays `src`, `dst` and `cost`.
+
+        Raises
+        ------
+        ValueError
+            If the rules parameter is not recognized.
+
+        Time Complexity: O(n*m) under the original rules
+        """
+        if rules not in ["original rules", "new rules"]:
+            raise ValueError("Unrecognized rules parameter.")
+
+        color, value = self.to_arrays()
+        src, dst = self.adjacent_edges(rules)
+
+        if rules == "new rules":
+            whites = np.flatnonzero(color == 0)
+            playable = np.flatnonzero(color != 4)
+            white_src = np.repeat(whites, len(playable))
+            white_dst = np.tile(playable, len(whites))
+            keep = white_src != white_dst
+            src = np.concatenate((src, white_src[keep]))
+            dst = np.concatenate((dst, white_dst[keep]))
+
+        order = np.lexsort((dst, src))
+        src, dst = src[order], dst[order]
+        flat_value = value.ravel().astype(np.int64)
+        return src, dst, np.abs(flat_value[src] - flat_value[dst])
+
+    def adjacent_edges(self, rules: str = "original rules") -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the allowed pairs of adjacent cells as flat arrays of cell ids.
+
+        Under the original rules these are all the allowed pairs. Under the new rules
+        only the pairs starting from a non-white cell are returned: the pairs starting
+        from a white cell (white cells pair with every non-black cell) are left implicit.
+
+        Parameters
+        ----------
+        rules : str, optional
+            The rules to apply for determining allowed pairs. Default is "original rules".
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The int64 arrays `src` and `dst`, pairs going right or down from `src`.
+
+        Raises
+        ------
+        ValueError
+            If the rules parameter is not recognized.
+        """
+        if rules not in ["original rules", "new rules"]:
+            raise ValueError("Unrecognized rules parameter.")
+
+        color, _ = self.to_arrays()
+        ids = np.arange(self.n * self.m, dtype=np.int64).reshape(self.n, self.m)
+        # Horizontal (right) and vertical (down) neighbours
+        right = Grid.compatible[color[:, :-1], color[:, 1:]]
+        down = Grid.compatible[color[:-1, :], color[1:, :]]
+        if rules == "new rules":
+            right &= color[:, :-1] != 0
+            down &= color[:-1, :] != 0
+        src = np.concatenate((ids[:, :-1][right], ids[:-1, :][down]))
+        dst = np.concatenate((ids[:, 1:][right], ids[1:, :][down]))
+        return src, dst
+
+    def cells(self, ids) -> list[tuple[int, int]]:
+        """
+        Converts cell ids `i * m + j` back to (i, j) coordinates.
+
+        Parameters
+        ----------
+        ids : np.ndarray
+            An integer array of cell ids.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The coordinates of each cell.
+        """
+        rows, cols = divmod(np.asarray(ids, dtype=np.int64), self.m)
+        return list(zip(rows.tolist(), cols.tolist()))
+
     def vois(self, i: int, j: int) -> list[tuple[int, int]]:
         """
         Returns the list of neighbors of the cell (i, j).
@@ -278,7 +652,7 @@ class Grid:
         return res
 
     @classmethod
-    def grid_from_file(cls, file_name: str, read_values: bool = False) -> 'Grid':
+    def grid_from_file(cls, file_name: str, read_values: bool = False, backend: str = "list") -> 'Grid':
         """
         Creates a Grid object from a file.
 
@@ -291,6 +665,8 @@ class Grid:
             - The next n lines contain m integers representing the values of the corresponding cells.
         read_values : bool, optional
             Indicates whether to read values after reading the colors. Requires the file to have 2n+1 lines.
+        backend : str, optional
+            The storage backend of the grid, "list" (default) or "numpy".
 
         Returns
         -------
@@ -327,7 +703,7 @@ class Grid:
                 else:
                     value = []
 
-                grid = Grid(n, m, color, value)
+                grid = Grid(n, m, color, value, backend)
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {file_name} does not exist.")
 
@@ -0,0 +1,165 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+
+class LegalMoves:
+    """
+    The set of legal moves of a game, updated as pairs are played and taken back.
+
+    The explicit pairs of the grid (see `PairSet`) are kept as an adjacency list, and each
+    free cell counts its free partners, so that playing or taking back a pair costs
+    O(degree). Under the new rules the pairs of the white cells are left implicit:
+    they exist as long as a free white cell and another free playable cell remain.
+
+    Attributes
+    ----------
+    grid : Grid
+        The game grid.
+    rules : str
+        The rules of the game.
+    live_pairs : int
+        The number of explicit pairs whose two cells are free.
+    free_whites : int
+        The number of free white cells pairing with every other cell (new rules only).
+    free_playable : int
+        The number of free non-black cells.
+    """
+
+    def __init__(self, grid: Grid, rules: str = "original rules"):
+        """
+        Initializes the legal moves of a grid where no pair was played yet.
+
+        Parameters
+        ----------
+        grid : Grid
+            The game grid.
+        rules : str, optional
+            The rules of the game. Default is "original rules".
+
+        Raises
+        ------
+        ValueError
+            If the rules parameter is not recognized.
+
+        Time Complexity: O(n*m * log(n*m))
+        """
+        pairs = PairSet(grid, rules)
+        self.grid = grid
+        self.rules = rules
+        size = grid.n * grid.m
+        self._white = [False] * size
+        for u in pairs.whites.tolist():
+            self._white[u] = True
+        self._playable = [False] * size
+        for u in pairs.playable.tolist():
+            self._playable[u] = True
+
+        # The pairs with a white cell are implicit under the new rules
+        self._adjacent = [[] for _ in range(size)]
+        for u, v in zip(pairs.adjacent_src.tolist(), pairs.adjacent_dst.tolist()):
+            if not self._white[u] and not self._white[v]:
+                self._adjacent[u].append(v)
+                self._adjacent[v].append(u)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Frees every cell, as at the start of a game.
+
+        Time Complexity: O(n*m)
+        """
+        self._free = self._playable.copy()
+        self._live_degree = [len(adjacent) for adjacent in self._adjacent]
+        self.live_pairs = sum(self._live_degree) // 2
+        self.free_whites = self._white.count(True)
+        self.free_playable = self._playable.count(True)
+
+    def __bool__(self) -> bool:
+        """
+        Tells whether a legal move is left.
+
+        Returns
+        -------
+        bool
+            True if some pair of free cells may still be played.
+
+        Time Complexity: O(1)
+        """
+        return self.live_pairs > 0 or (self.free_whites > 0 and self.free_playable > 1)
+
+    def is_free(self, cell: tuple[int, int]) -> bool:
+        """
+        Tells whether a cell is playable and not yet paired.
+
+        Parameters
+        ----------
+        cell : tuple[int, int]
+            The cell (i, j).
+
+        Returns
+        -------
+        bool
+            True if the cell is free.
+
+        Time Complexity: O(1)
+        """
+        i, j = cell
+        return self._free[i * self.grid.m + j]
+
+    def play(self, pair: tuple[tuple[int, int], tuple[int, int]]) -> None:
+        """
+        Marks the two cells of a pair as used.
+
+        Parameters
+        ----------
+        pair : tuple[tuple[int, int], tuple[int, int]]
+            The pair played.
+
+        Time Complexity: O(degree)
+        """
+        for i, j in pair:
+            self._occupy(i * self.grid.m + j)
+
+    def take_back(self, pair: tuple[tuple[int, int], tuple[int, int]]) -> None:
+        """
+        Frees the two cells of a pair taken back.
+
+        Parameters
+        ----------
+        pair : tuple[tuple[int, int], tuple[int, int]]
+            The pair taken back.
+
+        Time Complexity: O(degree)
+        """
+        for i, j in pair:
+            self._release(i * self.grid.m + j)
+
+    def _occupy(self, u: int) -> None:
+        """
+        Marks a cell id as used, updating the counters of its free partners.
+        """
+        if not self._free[u]:
+            return
+        self._free[u] = False
+        self.live_pairs -= self._live_degree[u]
+        for v in self._adjacent[u]:
+            self._live_degree[v] -= 1
+        self.free_playable -= 1
+        if self._white[u]:
+            self.free_whites -= 1
+
+    def _release(self, u: int) -> None:
+        """
+        Frees a cell id, updating the counters of its free partners.
+        """
+        if self._free[u] or not self._playable[u]:
+            return
+        self._free[u] = True
+        self.live_pairs += self._live_degree[u]
+        for v in self._adjacent[u]:
+            self._live_degree[v] += 1
+        self.free_playable += 1
+        if self._white[u]:
+            self.free_whites += 1
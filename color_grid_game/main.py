@@ -7,7 +7,10 @@ def main():
     # Set up argument parser
     parser = argparse.ArgumentParser(description="Solve color grid game with specified rules.")
     parser.add_argument('--rules', choices=['original', 'new'], default='original', help='Choose the rule set: original or new')
+    parser.add_argument('--components', action='store_true', help='Solve each connected component separately, large ones in parallel')
+    parser.add_argument('--cache', action='store_true', help='Reuse the solutions stored in the on-disk cache (timings then measure cache lookups)')
     args = parser.parse_args()
+    cache = SolutionCache() if args.cache else None
 
     data_path: str = "./input/"
     grid_files = [f for f in os.listdir(data_path) if f.endswith(".in")]
@@ -23,11 +26,21 @@ def main():
         solver_hungarian = Solver_Hungarian(grid, rules)
 
         start_blossom = time.time()
-        solver_blossom.run()
+        if cache is not None:
+            cache.run(solver_blossom)
+        elif args.components:
+            solver_blossom.run_by_components()
+        else:
+            solver_blossom.run()
         end_blossom = time.time()
 
         start_hungarian = time.time()
-        solver_hungarian.run()
+        if cache is not None:
+            cache.run(solver_hungarian)
+        elif args.components:
+            solver_hungarian.run_by_components()
+        else:
+            solver_hungarian.run()
         end_hungarian = time.time()
 
         blossom_score = solver_blossom.score()
@@ -37,7 +50,18 @@ def main():
         time_hungarian = end_hungarian - start_hungarian
 
         print(f"  Solver_Blossom {rules.capitalize()} score: {blossom_score},  Time : {time_blossom:.4f} seconds")
-        print(f"  Solver_Hungarian {rules.capitalize()} score: {hungarian_score},  Time : {time_hungarian:.4f} seconds\n")
+        print(f"  Solver_Hungarian {rules.capitalize()} score: {hungarian_score},  Time : {time_hungarian:.4f} seconds")
+
+        if Solver_ProfileDP.applies(grid, rules):
+            solver_profile_dp = Solver_ProfileDP(grid, rules)
+            start_profile_dp = time.time()
+            if cache is not None:
+                cache.run(solver_profile_dp)
+            else:
+                solver_profile_dp.run()
+            time_profile_dp = time.time() - start_profile_dp
+            print(f"  Solver_ProfileDP {rules.capitalize()} score: {solver_profile_dp.score()},  Time : {time_profile_dp:.4f} seconds")
+        print()
 
 if __name__ == '__main__':
     main()
@@ -37,12 +37,14 @@ class Minimax_Bot:
         Complexity : O(n*m * log(n*m))
         """ 
     
-        pairs = grid.all_pairs(rules)  # O(n*m)
+        pairs = PairSet(grid, rules)  # O(n*m), the pairs themselves are not listed
         if not pairs:
             return None
     
-        # 1) We sort all pairs by cost (from smallest to largest)
-        pairs_sorted = sorted(pairs, key=lambda p: grid.cost(p))  # O(n*m * log(n*m))
+        # 1) We go through the pairs by cost (from smallest to largest), lazily:
+        #    only the prefix needed for the opponent's answers is ever generated
+        pairs_by_cost = pairs.by_cost()
+        pairs_sorted = []
     
         best_score = float('inf')
         best_pair_for_us = None
@@ -55,12 +57,19 @@ class Minimax_Bot:
             # 2) Find the best possible pair for the opponent
             #    by going through pairs_sorted
             choice_adversaire = None
-            for candidate in pairs_sorted:  # In practice, we skip quickly if adjacency is limited
-                c0, c1 = candidate
+            k = 0
+            while True:  # In practice, we skip quickly if adjacency is limited
+                if k == len(pairs_sorted):
+                    candidate = next(pairs_by_cost, None)
+                    if candidate is None:
+                        break
+                    pairs_sorted.append(candidate)
+                cost, (c0, c1) = pairs_sorted[k]
                 if c0 not in used_cells and c1 not in used_cells:
                     # This pair is free in the modified grid
-                    choice_adversaire = candidate
+                    choice_adversaire = (c0, c1)
                     break
+                k += 1
             # If we didn't find any free pair => the opponent can't play
             # We can set cost=0 or "no impact from the opponent"
             
@@ -68,7 +77,7 @@ class Minimax_Bot:
                 # The opponent does not play
                 score = grid.cost(pair)
             else:
-                score =  grid.cost(pair) - grid.cost(choice_adversaire)
+                score =  grid.cost(pair) - cost
     
             # We take the pair that minimizes the score
             if score < best_score:
@@ -114,28 +123,25 @@ class Minimax_Bot:
         best_score = float('inf')
 
         for pair in pairs:
-            # Create a copy of the grid to simulate the move
-            grid_copy = Grid(grid.n, grid.m, [row.copy() for row in grid.color], [row.copy() for row in grid.value])
-
-            # Mark the current pair's cells as forbidden (black)
-            grid_copy.color[pair[0][0]][pair[0][1]] = 4
-            grid_copy.color[pair[1][0]][pair[1][1]] = 4
+            # Play the pair in place (its cells are blocked), instead of copying the grid
+            grid.make_move(pair)
 
             # Get remaining pairs after this move
-            remaining_pairs = grid_copy.all_pairs(rules)
+            remaining_pairs = grid.all_pairs(rules)
+            grid.unmake_move()
 
             # If no pairs remain after this move, skip it
             if not remaining_pairs:
                 continue
 
             # Find the opponent's best (minimum cost) move
-            opponent_best_pair = min(remaining_pairs, key=lambda x: grid_copy.cost(x))
+            opponent_best_pair = min(remaining_pairs, key=lambda x: grid.cost(x))
 
             # Calculate the score:
             # - Minimize our current move's cost
             # - Maximize the opponent's best move's cost
             current_move_cost = grid.cost(pair)
-            opponent_best_move_cost = grid_copy.cost(opponent_best_pair)
+            opponent_best_move_cost = grid.cost(opponent_best_pair)
 
             # Score combines our move cost and opponent's potential move cost
             # Lower score is better (penalizes both our move cost and opponent's potential low-cost move)
@@ -0,0 +1,318 @@
+import sys
+import os
+import heapq
+import bisect
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+
+class PairSet:
+    """
+    A lazy view of the allowed pairs of a grid.
+
+    It holds the same pairs as `Grid.all_pairs(rules)` without enumerating them.
+    Under the new rules a white cell pairs with every non-black cell, which makes
+    the list of pairs quadratic in the number of cells: these pairs are kept
+    implicit and rebuilt on demand from the color layout.
+
+    Attributes
+    ----------
+    grid : Grid
+        The grid whose pairs are represented.
+    rules : str
+        The rules used to determine allowed pairs.
+    adjacent_src : np.ndarray
+        Ids `i * m + j` of the first cell of the explicit (adjacent) pairs, sorted.
+    adjacent_dst : np.ndarray
+        Ids of the second cell of the explicit pairs.
+    whites : np.ndarray
+        Ids of the white cells pairing with every non-black cell
+        (always empty under the original rules).
+    playable : np.ndarray
+        Ids of the non-black cells.
+    """
+
+    def __init__(self, grid: Grid, rules: str = "original rules"):
+        """
+        Initializes the pair set from the color layout of the grid.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid whose pairs are represented.
+        rules : str, optional
+            The rules to apply for determining allowed pairs. Default is "original rules".
+
+        Raises
+        ------
+        ValueError
+            If the rules parameter is not recognized.
+
+        Time Complexity: O(n*m * log(n*m))
+        """
+        src, dst = grid.adjacent_edges(rules)
+        order = np.lexsort((dst, src))
+        self.grid = grid
+        self.rules = rules
+        self.adjacent_src = src[order]
+        self.adjacent_dst = dst[order]
+
+        color, value = grid.to_arrays()
+        self._color = color.ravel()
+        self._value = value.ravel().astype(np.int64)
+        self.playable = np.flatnonzero(self._color != 4)
+        if rules == "new rules":
+            self.whites = np.flatnonzero(self._color == 0)
+        else:
+            self.whites = np.zeros(0, dtype=np.int64)
+        self._is_white = np.zeros(grid.n * grid.m, dtype=bool)
+        self._is_white[self.whites] = True
+        self._cells = grid.cells(np.arange(grid.n * grid.m))
+
+        # Adjacency of the explicit pairs in both directions (CSR layout)
+        both_src = np.concatenate((self.adjacent_src, self.adjacent_dst))
+        both_dst = np.concatenate((self.adjacent_dst, self.adjacent_src))
+        order = np.lexsort((both_dst, both_src))
+        self._adjacent = both_dst[order]
+        self._adjacent_ptr = np.searchsorted(both_src[order], np.arange(grid.n * grid.m + 1))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of allowed pairs, as `len(grid.all_pairs(rules))` would.
+
+        Returns
+        -------
+        int
+            The number of pairs.
+
+        Time Complexity: O(1)
+        """
+        return len(self.adjacent_src) + len(self.whites) * (len(self.playable) - 1)
+
+    def __contains__(self, pair) -> bool:
+        """
+        Checks whether a pair ((i1, j1), (i2, j2)) is returned by `grid.all_pairs(rules)`.
+
+        Parameters
+        ----------
+        pair : tuple[tuple[int, int], tuple[int, int]]
+            The pair to check.
+
+        Returns
+        -------
+        bool
+            True if the pair is allowed, False otherwise.
+
+        Time Complexity: O(1)
+        """
+        try:
+            (i1, j1), (i2, j2) = pair
+        except (TypeError, ValueError):
+            return False
+        if not (self.grid._is_within_bounds(i1, j1) and self.grid._is_within_bounds(i2, j2)):
+            return False
+        u, v = i1 * self.grid.m + j1, i2 * self.grid.m + j2
+        if u == v or self._color[u] == 4 or self._color[v] == 4:
+            return False
+        if self._is_white[u]:
+            return True
+        is_adjacent = (i1 == i2 and j2 == j1 + 1) or (j1 == j2 and i2 == i1 + 1)
+        return is_adjacent and bool(Grid.compatible[self._color[u], self._color[v]])
+
+    def __iter__(self):
+        """
+        Iterates over the allowed pairs in the order of `grid.all_pairs(rules)`.
+
+        Yields
+        ------
+        tuple[tuple[int, int], tuple[int, int]]
+            The next pair of cells.
+        """
+        cells = self._cells
+        playable = self.playable.tolist()
+        adjacent_src = self.adjacent_src.tolist()
+        adjacent_dst = self.adjacent_dst.tolist()
+        k = 0
+        for u in playable:
+            if self._is_white[u]:
+                for x in playable:
+                    if x != u:
+                        yield (cells[u], cells[x])
+            else:
+                while k < len(adjacent_src) and adjacent_src[k] == u:
+                    yield (cells[u], cells[adjacent_dst[k]])
+                    k += 1
+
+    def neighbours(self, cell: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Returns the cells that can be paired with a given cell, in either direction.
+
+        Parameters
+        ----------
+        cell : tuple[int, int]
+            The cell (i, j).
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The sorted list of cells that can be paired with `cell`.
+
+        Raises
+        ------
+        IndexError
+            If the cell is out of the grid boundaries.
+        """
+        ids = self._neighbour_ids(cell)
+        return [self._cells[x] for x in ids.tolist()]
+
+    def degrees(self) -> np.ndarray:
+        """
+        Returns the number of cells each cell can be paired with.
+
+        Returns
+        -------
+        np.ndarray
+            An int64 array of length n*m indexed by cell id.
+        """
+        # Explicit pairs never start from a white cell, so only their end can be white
+        colored = ~self._is_white[self.adjacent_dst]
+        degrees = np.bincount(np.concatenate((self.adjacent_src[colored], self.adjacent_dst[colored])),
+                              minlength=self.grid.n * self.grid.m).astype(np.int64)
+        # White cells pair with every other playable cell, colored cells with every white cell
+        degrees[(self._color != 4) & ~self._is_white] += len(self.whites)
+        degrees[self._is_white] = len(self.playable) - 1
+        return degrees
+
+    def components(self) -> np.ndarray:
+        """
+        Labels the connected components of the pair graph.
+
+        Returns
+        -------
+        np.ndarray
+            An int64 array of length n*m indexed by cell id, holding the component of each
+            cell (numbered by smallest cell id) or -1 for cells that cannot be paired.
+
+        Time Complexity: O(n*m + P), P being the number of explicit pairs
+        """
+        labels = np.full(self.grid.n * self.grid.m, -1, dtype=np.int64)
+        degrees = self.degrees()
+        if len(self.whites):
+            # White cells pair with every playable cell, which are all connected through them
+            labels[degrees > 0] = 0
+            return labels
+        adjacent = self._adjacent.tolist()
+        pointers = self._adjacent_ptr.tolist()
+        label = 0
+        for root in np.flatnonzero(degrees > 0).tolist():
+            if labels[root] != -1:
+                continue
+            labels[root] = label
+            stack = [root]
+            while stack:
+                u = stack.pop()
+                for x in adjacent[pointers[u]:pointers[u + 1]]:
+                    if labels[x] == -1:
+                        labels[x] = label
+                        stack.append(x)
+            label += 1
+        return labels
+
+    def by_cost(self):
+        """
+        Iterates over the allowed pairs by increasing cost, lazily.
+
+        Ties are broken as in `sorted(grid.all_pairs(rules), key=grid.cost)`. Only the
+        pairs actually consumed are generated: each white cell walks outwards from its
+        position in the list of playable cells sorted by value.
+
+        Yields
+        ------
+        tuple[int, tuple[tuple[int, int], tuple[int, int]]]
+            The cost of the next pair and the pair.
+        """
+        cells = self._cells
+        value = self._value
+        cost = np.abs(value[self.adjacent_src] - value[self.adjacent_dst])
+        order = np.lexsort((self.adjacent_dst, self.adjacent_src, cost))
+        streams = [zip(cost[order].tolist(), self.adjacent_src[order].tolist(), self.adjacent_dst[order].tolist())]
+
+        if len(self.whites):
+            order = np.lexsort((self.playable, value[self.playable]))
+            sorted_ids = self.playable[order].tolist()
+            sorted_values = value[self.playable][order].tolist()
+            position = {x: k for k, x in enumerate(sorted_ids)}
+            streams += [self._white_stream(w, position[w], sorted_ids, sorted_values) for w in self.whites.tolist()]
+
+        for pair_cost, u, v in heapq.merge(*streams):
+            yield pair_cost, (cells[u], cells[v])
+
+    @staticmethod
+    def _white_stream(w: int, k: int, sorted_ids: list[int], sorted_values: list[int]):
+        """
+        Yields the pairs (cost, w, x) of a white cell w by increasing (cost, x).
+
+        Parameters
+        ----------
+        w : int
+            Id of the white cell.
+        k : int
+            Position of w in `sorted_ids`.
+        sorted_ids : list[int]
+            Ids of the playable cells sorted by (value, id).
+        sorted_values : list[int]
+            Values matching `sorted_ids`.
+        """
+        v_w = sorted_values[k]
+        # Cells of value v_w come first (cost 0), then the blocks of equal value closest to v_w
+        left = bisect.bisect_left(sorted_values, v_w)
+        right = bisect.bisect_right(sorted_values, v_w)
+        blocks = [range(left, right)]
+        d = 0
+        while blocks:
+            # Inside a block cells are sorted by id, so merging the blocks keeps ties ordered
+            for x in heapq.merge(*(map(sorted_ids.__getitem__, block) for block in blocks)):
+                if x != w:
+                    yield d, w, x
+            d_left = v_w - sorted_values[left - 1] if left > 0 else float('inf')
+            d_right = sorted_values[right] - v_w if right < len(sorted_values) else float('inf')
+            d = min(d_left, d_right)
+            blocks = []
+            if d_left == d != float('inf'):
+                start = bisect.bisect_left(sorted_values, sorted_values[left - 1], 0, left)
+                blocks.append(range(start, left))
+                left = start
+            if d_right == d != float('inf'):
+                end = bisect.bisect_right(sorted_values, sorted_values[right], right)
+                blocks.append(range(right, end))
+                right = end
+
+    def _neighbour_ids(self, cell: tuple[int, int]) -> np.ndarray:
+        """
+        Returns the sorted ids of the cells that can be paired with a given cell.
+
+        Parameters
+        ----------
+        cell : tuple[int, int]
+            The cell (i, j).
+
+        Returns
+        -------
+        np.ndarray
+            The ids of the neighbours of `cell` in the pair graph.
+
+        Raises
+        ------
+        IndexError
+            If the cell is out of the grid boundaries.
+        """
+        i, j = cell
+        if not self.grid._is_within_bounds(i, j):
+            raise IndexError("Cell index out of grid boundaries.")
+        u = i * self.grid.m + j
+        if self._color[u] == 4:
+            return np.zeros(0, dtype=np.int64)
+        if self._is_white[u]:
+            return self.playable[self.playable != u]
+        adjacent = self._adjacent[self._adjacent_ptr[u]:self._adjacent_ptr[u + 1]]
+        return np.union1d(adjacent, self.whites)
@@ -964,10 +964,12 @@ class SolverManager:
     ----------
     solver : Solver
         The solver for the game.
-    solver_general : Solver_Hungarian or Solver_Blossom
+    solver_general : Solver_ProfileDP, Solver_Hungarian or Solver_Wildcard
         The general solver for the game.
     general_score : int
         The score of the general solver.
+    legal_moves : LegalMoves
+        The moves left in the game, updated as pairs are played and taken back.
     """
 
     def __init__(self, grid, rules):
@@ -982,14 +984,18 @@ class SolverManager:
             The rules to use for the solver.
         """
         self.solver = Solver(grid)
-        if rules == "original rules":
+        self.legal_moves = LegalMoves(grid, rules)
+        if rules == "original rules" and Solver_ProfileDP.applies(grid, rules):
+            self.solver_general = Solver_ProfileDP(grid, rules)
+        elif rules == "original rules":
             self.solver_general = Solver_Hungarian(grid, rules)
         elif rules == "new rules":
-            self.solver_general = Solver_Blossom(grid, rules)
+            self.solver_general = Solver_Wildcard(grid, rules)
         else:
             raise ValueError("Unknown rules specified")
 
-        self.solver_general.run()
+        # Reopening a grid reuses the pairs stored on disk instead of solving it again
+        SolutionCache().run(self.solver_general)
         self.general_score = self.solver_general.score()
 
     def can_pair(self, color1, color2):
@@ -1214,15 +1220,34 @@ class Game:
         self.player1_bot_type = None
         self.player2_bot_type = None
 
-    def create_grid_copy(self, grid, player_pairs):
-        grid_copy = Grid(grid.n, grid.m,
-                         [row.copy() for row in grid.color],
-                         [row.copy() for row in grid.value])
-        for pair_list in player_pairs:
+    def play_player_pairs(self, grid, player_pairs):
+        """
+        Plays the pairs of both players on the grid in place, so that a bot sees their
+        cells as blocked without the grid being copied. The moves are taken back with
+        `take_back_player_pairs`.
+
+        Parameters
+        ----------
+        grid : Grid
+            The game grid.
+        player_pairs : list of list
+            The pairs played by each player.
+        """
+        for player, pair_list in enumerate(player_pairs, start=1):
             for pair in pair_list:
-                for (i, j) in pair:
-                    grid_copy.color[i][j] = 4
-        return grid_copy
+                grid.make_move(pair, player)
+
+    def take_back_player_pairs(self, grid):
+        """
+        Takes back the moves played with `play_player_pairs`.
+
+        Parameters
+        ----------
+        grid : Grid
+            The game grid.
+        """
+        while grid.moves:
+            grid.unmake_move()
 
     def main(self):
         """
@@ -1551,12 +1576,15 @@ class Game:
             current_time = pygame.time.get_ticks()
             if not self.game_over:
                 if self.current_player == 1 and self.player1_bot_type is not None:
-                    grid_copy = self.create_grid_copy(grid, self.player_pairs)
-                    if self.player1_bot_type == 'mcts':
-                        bot = MCTS_Bot(grid_copy, simulations_per_move=20, epsilon=0.1)
-                        bot_pair = bot.mcts_move()
-                    elif self.player1_bot_type == 'minimax':
-                        bot_pair = Minimax_Bot.move_to_play(grid_copy, self.selected_rules)
+                    self.play_player_pairs(grid, self.player_pairs)
+                    try:
+                        if self.player1_bot_type == 'mcts':
+                            bot = MCTS_Bot(grid, simulations_per_move=20, epsilon=0.1)
+                            bot_pair = bot.mcts_move()
+                        elif self.player1_bot_type == 'minimax':
+                            bot_pair = Minimax_Bot.move_to_play(grid, self.selected_rules)
+                    finally:
+                        self.take_back_player_pairs(grid)
                     if bot_pair is not None:
                         valid = solver_manager.pair_is_valid(bot_pair, [], grid, self.player_pairs, self.selected_rules)
                         if valid:
@@ -1571,6 +1599,7 @@ class Game:
                             elapsed_bot = (bot_end_time - self.start_times[0]) / 1000.0
                             self.player_time_used[0] += elapsed_bot
                             self.player_pairs[0].append(bot_pair)
+                            solver_manager.legal_moves.play(bot_pair)
                             self.player_scores[0] = solver_manager.calculate_two_player_score(self.player_pairs[0], grid)
                             self.current_player = 2
                             self.start_times[1] = pygame.time.get_ticks()
@@ -1579,12 +1608,15 @@ class Game:
                     else:
                         self.game_over = True
                 elif self.current_player == 2 and self.player2_bot_type is not None:
-                    grid_copy = self.create_grid_copy(grid, self.player_pairs)
-                    if self.player2_bot_type == 'mcts':
-                        bot = MCTS_Bot(grid_copy, simulations_per_move=20, epsilon=0.1)
-                        bot_pair = bot.mcts_move()
-                    elif self.player2_bot_type == 'minimax':
-                        bot_pair = Minimax_Bot.move_to_play(grid_copy, self.selected_rules)
+                    self.play_player_pairs(grid, self.player_pairs)
+                    try:
+                        if self.player2_bot_type == 'mcts':
+                            bot = MCTS_Bot(grid, simulations_per_move=20, epsilon=0.1)
+                            bot_pair = bot.mcts_move()
+                        elif self.player2_bot_type == 'minimax':
+                            bot_pair = Minimax_Bot.move_to_play(grid, self.selected_rules)
+                    finally:
+                        self.take_back_player_pairs(grid)
                     if bot_pair is not None:
                         valid = solver_manager.pair_is_valid(bot_pair, [], grid, self.player_pairs, self.selected_rules)
                         if valid:
@@ -1600,6 +1632,7 @@ class Game:
                             self.player_time_used[1] += elapsed_bot
 
                             self.player_pairs[1].append(bot_pair)
+                            solver_manager.legal_moves.play(bot_pair)
                             self.player_scores[1] = solver_manager.calculate_two_player_score(self.player_pairs[1], grid)
                             self.current_player = 1
                             self.start_times[0] = pygame.time.get_ticks()
@@ -1643,6 +1676,7 @@ class Game:
                                 for pair in solver_manager.solver.pairs:
                                     if (i, j) in pair:
                                         solver_manager.solver.pairs.remove(pair)
+                                        solver_manager.legal_moves.take_back(pair)
                                         break
                             elif (i, j) not in [cell for pair in solver_manager.solver.pairs for cell in pair]:
                                 self.selected_cells.append((i, j))
@@ -1660,12 +1694,14 @@ class Game:
                                         if solver_manager.can_pair(color1, color2):
                                             if self.player_mode == 'one':
                                                 solver_manager.solver.pairs.append((self.selected_cells[0], self.selected_cells[1]))
+                                                solver_manager.legal_moves.play((self.selected_cells[0], self.selected_cells[1]))
                                             elif self.player_mode in ['bot', 'deepblue']:
                                                 valid = solver_manager.pair_is_valid((self.selected_cells[0], self.selected_cells[1]), [], grid, self.player_pairs, self.selected_rules)
                                                 if valid:
                                                     elapsed = (pygame.time.get_ticks() - self.start_times[0]) / 1000.0
                                                     self.player_time_used[0] += elapsed
                                                     self.player_pairs[0].append((self.selected_cells[0], self.selected_cells[1]))
+                                                    solver_manager.legal_moves.play((self.selected_cells[0], self.selected_cells[1]))
                                                     self.player_scores[0] = solver_manager.calculate_two_player_score(self.player_pairs[0], grid)
                                                     self.current_player = 2
                                                     self.start_times[1] = pygame.time.get_ticks()
@@ -1676,6 +1712,7 @@ class Game:
                                                     elapsed = (pygame.time.get_ticks() - self.start_times[self.current_player - 1]) / 1000.0
                                                     self.player_time_used[self.current_player - 1] += elapsed
                                                     self.player_pairs[self.current_player - 1].append((self.selected_cells[0], self.selected_cells[1]))
+                                                    solver_manager.legal_moves.play((self.selected_cells[0], self.selected_cells[1]))
                                                     self.player_scores[self.current_player - 1] = solver_manager.calculate_two_player_score(self.player_pairs[self.current_player - 1], grid)
                                                     self.current_player = 3 - self.current_player
                                                     self.start_times[self.current_player - 1] = pygame.time.get_ticks()
@@ -1712,6 +1749,7 @@ class Game:
 
                             if self.pressed_button == 'reset':
                                 solver_manager.solver.pairs = []
+                                solver_manager.legal_moves.reset()
                                 self.selected_cells = []
                                 self.game_over = False
                                 self.show_solution = False
@@ -1831,9 +1869,7 @@ class Game:
             self.ui_manager.draw_menu_button(window_size, self.pressed_button == 'menu')
             pygame.display.flip()
 
-            if not self.show_solution and not any(
-            solver_manager.pair_is_valid(pair, solver_manager.solver.pairs, grid, self.player_pairs, self.selected_rules)
-            for pair in grid.all_pairs(self.selected_rules)):
+            if not self.show_solution and not solver_manager.legal_moves:
                 if not self.game_over:
                     current_time = pygame.time.get_ticks()
                     elapsed = (current_time - self.start_times[self.current_player - 1]) / 1000.0
@@ -1852,6 +1888,7 @@ class Game:
                         self.player_time_used = [0.0, 0.0]
                         self.start_times = [pygame.time.get_ticks(), 0]
                         solver_manager.solver.pairs = []
+                        solver_manager.legal_moves.reset()
                         self.selected_cells = []
                         self.game_over = False
 
@@ -1878,6 +1915,7 @@ class Game:
                         self.player_time_used = [0.0, 0.0]
                         self.start_times = [pygame.time.get_ticks(), 0]
                         self.player_pairs = [[], []]
+                        solver_manager.legal_moves.reset()
                         self.player_scores = [0, 0]
                         self.current_player = 1
                         self.game_over = False
@@ -1905,6 +1943,7 @@ class Game:
                         self.player_time_used = [0.0, 0.0]
                         self.start_times = [pygame.time.get_ticks(), 0]
                         self.player_pairs = [[], []]
+                        solver_manager.legal_moves.reset()
                         self.player_scores = [0, 0]
                         self.current_player = 1
                         self.game_over = False
@@ -1931,6 +1970,7 @@ class Game:
                         self.player_time_used = [0.0, 0.0]
                         self.start_times = [pygame.time.get_ticks(), 0]
                         self.player_pairs = [[], []]
+                        solver_manager.legal_moves.reset()
                         self.player_scores = [0, 0]
                         self.current_player = 1
                         self.game_over = False
@@ -1958,6 +1998,7 @@ class Game:
                         self.player_time_used = [0.0, 0.0]
                         self.start_times = [pygame.time.get_ticks(), 0]
                         self.player_pairs = [[], []]
+                        solver_manager.legal_moves.reset()
                         self.player_scores = [0, 0]
                         self.current_player = 1
                         self.game_over = False
@@ -0,0 +1,163 @@
+import sys
+import os
+import json
+import hashlib
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+
+class SolutionCache:
+    """
+    A persistent on-disk cache of solver results.
+
+    Each result is stored in its own JSON file, named after a content hash of the grid
+    (n, m, colors and values), the rules, the solver class and the arguments of `run()`.
+    The modification time of a file records its last use, and the least recently used
+    results are evicted when the cache exceeds its number of entries or its size.
+
+    Attributes
+    ----------
+    directory : str
+        The directory holding the cached results.
+    max_entries : int
+        The maximum number of cached results.
+    max_bytes : int
+        The maximum total size of the cached results, in bytes.
+    """
+
+    default_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.solution_cache'))
+
+    def __init__(self, directory: str = None, max_entries: int = 256, max_bytes: int = 64 * 2**20):
+        """
+        Initializes the cache, creating its directory if needed.
+
+        Parameters
+        ----------
+        directory : str, optional
+            The directory holding the cached results. Default is `.solution_cache` next to the package.
+        max_entries : int, optional
+            The maximum number of cached results. Default is 256.
+        max_bytes : int, optional
+            The maximum total size of the cached results, in bytes. Default is 64 MiB.
+        """
+        self.directory = directory if directory is not None else self.default_directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(grid: Grid, rules: str, solver_name: str, **run_kwargs) -> str:
+        """
+        Computes the content hash identifying a solver run.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid solved.
+        rules : str
+            The rules used.
+        solver_name : str
+            The name of the solver class.
+        **run_kwargs
+            The keyword arguments of `run()`.
+
+        Returns
+        -------
+        str
+            The hexadecimal SHA-256 digest.
+        """
+        color, value = grid.to_arrays()
+        digest = hashlib.sha256()
+        digest.update(repr((grid.n, grid.m, rules, solver_name, sorted(run_kwargs.items()))).encode())
+        digest.update(np.ascontiguousarray(color, dtype=np.int8).tobytes())
+        digest.update(np.ascontiguousarray(value, dtype='<i8').tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Returns the cached pairs of a key, marking it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+
+        Returns
+        -------
+        list of tuple or None
+            The cached pairs, or None if the key is not cached.
+        """
+        path = os.path.join(self.directory, key + ".json")
+        try:
+            with open(path, "r") as file:
+                pairs = json.load(file)["pairs"]
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return [(tuple(cell1), tuple(cell2)) for cell1, cell2 in pairs]
+
+    def put(self, key: str, pairs: list[tuple[tuple[int, int], tuple[int, int]]]) -> None:
+        """
+        Stores the pairs of a key, then evicts the least recently used results beyond the limits.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+        pairs : list of tuple
+            The pairs to store.
+        """
+        pairs = [[[int(i1), int(j1)], [int(i2), int(j2)]] for (i1, j1), (i2, j2) in pairs]
+        # Write to a temporary file first so that readers never see a partial result
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "w") as file:
+            json.dump({"pairs": pairs}, file)
+        os.replace(temporary, os.path.join(self.directory, key + ".json"))
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used results until the cache fits its limits.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            _, size, name = entries.pop(0)
+            total -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def run(self, solver: Solver, **run_kwargs) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Runs a solver through the cache: the pairs are reused when the same run was cached.
+
+        Parameters
+        ----------
+        solver : Solver
+            The solver to run.
+        **run_kwargs
+            Keyword arguments passed to `run()`.
+
+        Returns
+        -------
+        list of tuple
+            The pairs of the solver, also stored in solver.pairs.
+        """
+        key = self.key(solver.grid, solver.rules, type(solver).__name__, **run_kwargs)
+        pairs = self.get(key)
+        if pairs is None:
+            pairs = solver.run(**run_kwargs)
+            self.put(key, pairs)
+        solver.pairs = pairs
+        return pairs
@@ -1,5 +1,6 @@
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from color_grid_game import *
@@ -16,6 +17,10 @@ class Solver:
         A list of pairs, each being a tuple ((i1, j1), (i2, j2)) representing paired cells.
     rules : str
         The rules to apply for solving the grid. Default is "original rules".
+    removed : set[tuple[int, int]]
+        Cells removed from the problem by `remove_cells` (played or blocked).
+    fixed_pairs : list[tuple[tuple[int, int], tuple[int, int]]]
+        Pairs forced into the solution by `add_pair_constraint`.
     """
 
     def __init__(self, grid: Grid, rules="original rules"):
@@ -38,6 +43,8 @@ class Solver:
         self.grid = grid
         self.pairs = []
         self.rules = rules
+        self.removed = set()
+        self.fixed_pairs = []
 
     def score(self) -> int:
         """
@@ -56,6 +63,9 @@ class Solver:
         ValueError
             If any cell in pairs is invalid.
         """
+        if self.grid.backend == "numpy":
+            return self._score_numpy()
+
         # Add all paired cells to the set and calculate the cost of each pair
         score = sum(self.grid.cost(pair) for pair in self.pairs)
         taken = set([cell for pair in self.pairs for cell in pair])
@@ -63,3 +73,159 @@ class Solver:
                      for j in range(self.grid.m)
                      if (i, j) not in taken and not self.grid.is_forbidden(i, j))
         return score
+
+    def _score_numpy(self) -> int:
+        """
+        Vectorized version of `score` for grids using the "numpy" backend.
+
+        Returns
+        -------
+        int
+            The computed score.
+
+        Raises
+        ------
+        ValueError
+            If any cell in pairs is invalid.
+        """
+        color, value = self.grid.to_arrays()
+        unpaired = color != 4
+        score = 0
+        if self.pairs:
+            cells = np.asarray(self.pairs, dtype=np.int64).reshape(-1, 2)
+            score += int(self.grid.costs(cells).sum())
+            unpaired[cells[:, 0], cells[:, 1]] = False
+        score += int(value[unpaired].sum(dtype=np.int64))
+        return score
+
+    def remove_cells(self, cells) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Removes cells from the problem (for instance cells played or blocked) and re-optimizes the pairs.
+
+        This default implementation solves again from scratch, on a copy of the grid where the
+        removed cells are black. Solvers keeping a warm-startable state override it.
+
+        Parameters
+        ----------
+        cells : iterable of tuple[int, int]
+            The cells to remove.
+
+        Returns
+        -------
+        list of tuple
+            The fixed pairs followed by the optimized pairs of the remaining cells, also stored in self.pairs.
+        """
+        self.removed.update(cells)
+        color, value = self.grid.to_arrays()
+        color = color.copy()
+        for i, j in self.removed:
+            color[i, j] = 4
+        grid = Grid(self.grid.n, self.grid.m, color.tolist(), value.tolist(), backend=self.grid.backend)
+        self.pairs = self.fixed_pairs + type(self)(grid, self.rules).run()
+        return self.pairs
+
+    def add_pair_constraint(self, pair) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Forces a pair into the solution (for instance a pair just played) and re-optimizes the other pairs.
+
+        Parameters
+        ----------
+        pair : tuple[tuple[int, int], tuple[int, int]]
+            The pair to force.
+
+        Returns
+        -------
+        list of tuple
+            The fixed pairs followed by the optimized pairs of the remaining cells, also stored in self.pairs.
+
+        Raises
+        ------
+        ValueError
+            If the pair is not allowed or uses a removed cell.
+        """
+        (i1, j1), (i2, j2) = pair
+        if not (self.grid._is_within_bounds(i1, j1) and self.grid._is_within_bounds(i2, j2)):
+            raise ValueError(f"The pair {pair} cannot be played.")
+        color1, color2 = self.grid.color[i1][j1], self.grid.color[i2][j2]
+        if self.rules == "new rules" and (color1 == 0 or color2 == 0):
+            allowed = (i1, j1) != (i2, j2) and color1 != 4 and color2 != 4
+        else:
+            allowed = abs(i1 - i2) + abs(j1 - j2) == 1 and bool(Grid.compatible[color1, color2])
+        if not allowed or (i1, j1) in self.removed or (i2, j2) in self.removed:
+            raise ValueError(f"The pair {pair} cannot be played.")
+        self.fixed_pairs.append(pair)
+        return self.remove_cells(pair)
+
+    def run_by_components(self, max_workers: int = None, parallel_size: int = 1000, **run_kwargs) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Runs the solver separately on each connected component of the pair graph.
+
+        Black cells and incompatible colors often split the pair graph into independent
+        components whose optimal pairs simply add up. Each component is copied into its own
+        grid (bounding box, other cells black) and solved with `run()` of the same solver
+        class: small components inline, large ones in a pool of processes.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The number of processes of the pool. Default is None (number of CPUs); 1 solves everything inline.
+        parallel_size : int, optional
+            The number of cells from which a component is solved in the pool. Default is 1000.
+        **run_kwargs
+            Keyword arguments passed to `run()`.
+
+        Returns
+        -------
+        list of tuple
+            The merged list of pairs, also stored in self.pairs.
+        """
+        labels = PairSet(self.grid, self.rules).components()
+        color, value = self.grid.to_arrays()
+        ids = np.flatnonzero(labels >= 0)
+        ids = ids[np.argsort(labels[ids], kind="stable")]
+        bounds = np.searchsorted(labels[ids], np.arange(labels.max() + 2))
+
+        # One small grid per component, its origin keeping the parity of i + j
+        jobs = []
+        for k in range(len(bounds) - 1):
+            rows, cols = divmod(ids[bounds[k]:bounds[k + 1]], self.grid.m)
+            if len(rows) < 2:
+                continue
+            i0, j0 = int(rows.min()), int(cols.min())
+            if (i0 + j0) % 2:
+                i0, j0 = (i0 - 1, j0) if i0 > 0 else (i0, j0 - 1)
+            sub_color = np.full((rows.max() + 1 - i0, cols.max() + 1 - j0), 4, dtype=np.int8)
+            sub_color[rows - i0, cols - j0] = color[rows, cols]
+            sub_value = value[i0:rows.max() + 1, j0:cols.max() + 1]
+            jobs.append((len(rows), i0, j0, (type(self), self.rules, sub_color, sub_value, self.grid.backend, run_kwargs)))
+
+        results = {}
+        large = [k for k, job in enumerate(jobs) if job[0] >= parallel_size]
+        if len(large) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {k: pool.submit(_solve_component, *jobs[k][3]) for k in large}
+                for k, job in enumerate(jobs):
+                    if k not in futures:
+                        results[k] = _solve_component(*job[3])
+                results.update((k, future.result()) for k, future in futures.items())
+        else:
+            results = {k: _solve_component(*job[3]) for k, job in enumerate(jobs)}
+
+        self.pairs = []
+        for k, (_, i0, j0, _) in enumerate(jobs):
+            self.pairs.extend(((i1 + i0, j1 + j0), (i2 + i0, j2 + j0)) for (i1, j1), (i2, j2) in results[k])
+        return self.pairs
+
+
+def _solve_component(solver_class, rules, color, value, backend, run_kwargs):
+    """
+    Solves the grid of one component (module-level so that it can run in a worker process).
+
+    Returns
+    -------
+    list of tuple
+        The pairs found, in the coordinates of the component grid.
+    """
+    n, m = color.shape
+    grid = Grid(n, m, color.tolist(), value.tolist(), backend=backend)
+    return solver_class(grid, rules).run(**run_kwargs)
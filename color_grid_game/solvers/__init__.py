@@ -10,3 +10,5 @@ from .solver_hungarian import Solver_Hungarian
 from .solver_blossom import Solver_Blossom
 
 
+from .solver_wildcard import Solver_Wildcard
+from .solver_profile_dp import Solver_ProfileDP
@@ -7,12 +7,18 @@ from color_grid_game import *
 class Solver_Blossom(Solver):
     """
     A solver that uses weighted matching to minimize the score in a grid.
-    Adapted to use a NetworkX graph instead of an adjacency dictionary.
+    The matching is computed by an in-house Edmonds blossom algorithm working on integer cell ids.
     """
 
-    def run(self):
+    def run(self, verify_optimum: bool = False):
         """
-        Builds a NetworkX graph and uses the max_weight_matching algorithm from NetworkX.
+        Builds the weighted pair graph on integer ids and computes a maximum weight matching.
+
+        Parameters
+        ----------
+        verify_optimum : bool, optional
+            Whether to check the optimality of the matching with its dual solution
+            (debugging aid, slower). Default is False.
 
         Returns
         -------
@@ -24,198 +30,145 @@ class Solver_Blossom(Solver):
         ValueError
             If the graph is empty or if pairs are invalid.
         """
-        pairs = self.grid.all_pairs(self.rules)
-        G = nx.Graph()
-        for u, v in pairs:
-            cost = self.grid.cost((u, v))
-            value_u = self.grid.value[u[0]][u[1]]
-            value_v = self.grid.value[v[0]][v[1]]
-            weight = cost - value_u - value_v
-            G.add_edge(u, v, weight=-weight)
-
-        matching = nx.max_weight_matching(G, maxcardinality=False)
-        self.pairs = list(matching)
-
+        pair_set = PairSet(self.grid, self.rules)
+        flat_value = self.grid.to_arrays()[1].ravel().astype(np.int64)
+        src, dst = pair_set.adjacent_src, pair_set.adjacent_dst
+
+        # Implicit pairs of white cells (new rules), each undirected pair listed once
+        colored = np.setdiff1d(pair_set.playable, pair_set.whites)
+        whites = pair_set.whites
+        for k, w in enumerate(whites.tolist()):
+            others = np.concatenate((colored, whites[k + 1:]))
+            src = np.concatenate((src, np.full(len(others), w)))
+            dst = np.concatenate((dst, others))
+
+        # Pairing u and v lowers the score by value_u + value_v - cost = 2 * min(value_u, value_v)
+        weight = 2 * np.minimum(flat_value[src], flat_value[dst])
+
+        # Dense vertex ids over the cells that appear in a pair
+        vertices = np.unique(np.concatenate((src, dst)))
+        edges = list(zip(np.searchsorted(vertices, src).tolist(), np.searchsorted(vertices, dst).tolist(),
+                         weight.tolist()))
+        mate = self.max_weight_matching(edges, len(vertices), verify_optimum=verify_optimum)
+
+        cells = self.grid.cells(vertices)
+        self.pairs = [(cells[v], cells[w]) for v, w in enumerate(mate) if v < w]
         return self.pairs
-    
-    @staticmethod
-    def matching_dict_to_set(matching):
-        """
-        Converts matching dictionary format to matching set format.
-
-        Parameters
-        ----------
-        matching : dict
-            A dictionary representing the matching where keys are nodes and values are their matched pairs.
-
-        Returns
-        -------
-        set
-            A set of edges representing the matching.
-
-        Raises
-        ------
-        ValueError
-            If a self-loop is detected in the matching.
-        """
-        edges = set()
-        for edge in matching.items():
-            u, v = edge
-            if (v, u) in edges or edge in edges:
-                continue
-            if u == v:
-                raise ValueError(f"Self-loops cannot appear in matchings {edge}")
-            edges.add(edge)
-        return edges
 
     @staticmethod
-    def max_weight_matching(G, maxcardinality=False, weight="weight"):
+    def max_weight_matching(edges: list[tuple[int, int, int]], nvertex: int, maxcardinality: bool = False,
+                            verify_optimum: bool = False) -> list[int]:
         """
-        Compute a maximum-weighted matching of the graph G.
+        Compute a maximum-weighted matching of a general graph with Edmonds' blossom algorithm.
+
+        Vertices are the integers 0 to nvertex - 1 and blossoms get the ids nvertex to
+        2 * nvertex - 1, so that the whole state (`mate`, `label`, `dualvar`, `inblossom`, ...)
+        is stored in flat lists. Edges are referred to by their index k in `edges`, and
+        their endpoints by p = 2 * k (first vertex) and p = 2 * k + 1 (second vertex).
 
         Parameters
         ----------
-        G : networkx.Graph
-            The input graph with edge weights.
+        edges : list[tuple[int, int, int]]
+            The edges (i, j, weight) of the graph, without self-loops.
+        nvertex : int
+            The number of vertices.
         maxcardinality : bool, optional
-            Whether to compute a maximum cardinality matching.
-        weight : str, optional
-            The attribute key for edge weights.
+            Whether to compute a maximum cardinality matching (of maximum weight among them).
+        verify_optimum : bool, optional
+            Whether to check the optimality conditions at the end (only for integer weights).
 
         Returns
         -------
-        set
-            A set of edges representing the maximum-weighted matching.
+        list[int]
+            For each vertex, the vertex it is matched with, or -1.
 
         Raises
         ------
-        ValueError
-            If the input graph is not valid or if an error occurs during computation.
-        """
+        AssertionError
+            If `verify_optimum` is set and the optimality conditions do not hold.
 
-        class NoNode:
-            pass
+        Complexity : O(V^3)
+        """
+        if not edges:
+            return [-1] * nvertex
+
+        nedge = len(edges)
+        maxweight = max(0, max(wt for _, _, wt in edges))
+        allinteger = all(isinstance(wt, int) for _, _, wt in edges)
+
+        # endpoint[p] is the vertex at endpoint p, neighbend[v] the remote endpoints of the edges of v
+        endpoint = [edges[p // 2][p % 2] for p in range(2 * nedge)]
+        neighbend = [[] for _ in range(nvertex)]
+        for k, (i, j, _) in enumerate(edges):
+            neighbend[i].append(2 * k + 1)
+            neighbend[j].append(2 * k)
+
+        # mate[v] is the remote endpoint of the matched edge of v, or -1
+        mate = [-1] * nvertex
+        # label: 0 free, 1 S-vertex/blossom, 2 T-vertex/blossom (5 temporarily in scanBlossom)
+        label = [0] * (2 * nvertex)
+        labelend = [-1] * (2 * nvertex)
+        inblossom = list(range(nvertex))
+        blossomparent = [-1] * (2 * nvertex)
+        blossomchilds = [None] * (2 * nvertex)
+        blossombase = list(range(nvertex)) + [-1] * nvertex
+        blossomendps = [None] * (2 * nvertex)
+        bestedge = [-1] * (2 * nvertex)
+        blossombestedges = [None] * (2 * nvertex)
+        unusedblossoms = list(range(nvertex, 2 * nvertex))
+        dualvar = [maxweight] * nvertex + [0] * nvertex
+        allowedge = [False] * nedge
+        queue = []
 
-        class Blossom:
+        def slack(k):
             """
-            Internal class to represent a blossom in the matching algorithm.
+            Returns the slack of edge k (not valid for edges inside a blossom).
             """
+            i, j, wt = edges[k]
+            return dualvar[i] + dualvar[j] - 2 * wt
 
-            __slots__ = ["childs", "edges", "mybestedges"]
-
-            def __init__(self):
-                self.childs = []
-                self.edges = []
-                self.mybestedges = None
-
-            def leaves(self):
-                """
-                Yield all leaf nodes in the blossom.
-
-                Yields
-                ------
-                node
-                    The next leaf node in the blossom.
-                """
-                stack = [*self.childs]
-                while stack:
-                    t = stack.pop()
-                    if isinstance(t, Blossom):
-                        stack.extend(t.childs)
-                    else:
-                        yield t
-
-        gnodes = list(G)
-        if not gnodes:
-            return set()
-
-        maxweight = 0
-        allinteger = True
-        for i, j, d in G.edges(data=True):
-            wt = d.get(weight, 1)
-            if i != j and wt > maxweight:
-                maxweight = wt
-            allinteger = allinteger and (str(type(wt)).split("'")[1] in ("int", "long"))
-
-        mate = {}
-        label = {}
-        labeledge = {}
-        inblossom = dict(zip(gnodes, gnodes))
-        blossomparent = dict(zip(gnodes, repeat(None)))
-        blossombase = dict(zip(gnodes, gnodes))
-        bestedge = {}
-        dualvar = dict(zip(gnodes, repeat(maxweight)))
-        blossomdual = {}
-        allowedge = {}
-        queue = []
-
-        def slack(v, w):
+        def blossomLeaves(b):
             """
-            Calculate the slack for the edge (v, w).
-
-            Parameters
-            ----------
-            v : node
-                The first node.
-            w : node
-                The second node.
-
-            Returns
-            -------
-            float
-                The slack value for the edge (v, w).
+            Yields the vertices contained in blossom (or vertex) b.
             """
-            return dualvar[v] + dualvar[w] - 2 * G[v][w].get(weight, 1)
+            if b < nvertex:
+                yield b
+                return
+            stack = list(blossomchilds[b])
+            while stack:
+                t = stack.pop()
+                if t < nvertex:
+                    yield t
+                else:
+                    stack.extend(blossomchilds[t])
 
-        def assignLabel(w, t, v):
+        def assignLabel(w, t, p):
             """
-            Assign a label to a node or blossom.
-
-            Parameters
-            ----------
-            w : node
-                The node to label.
-            t : int
-                The label type (1 or 2).
-            v : node
-                The node connected to w, or None.
+            Labels vertex w and its top-level blossom with t, reached through endpoint p.
             """
-            b = inblossom[w]
-            assert label.get(w) is None and label.get(b) is None
-            label[w] = label[b] = t
-            if v is not None:
-                labeledge[w] = labeledge[b] = (v, w)
-            else:
-                labeledge[w] = labeledge[b] = None
-            bestedge[w] = bestedge[b] = None
-            if t == 1:
-                if isinstance(b, Blossom):
-                    queue.extend(b.leaves())
-                else:
-                    queue.append(b)
-            elif t == 2:
+            while True:
+                b = inblossom[w]
+                assert label[w] == 0 and label[b] == 0
+                label[w] = label[b] = t
+                labelend[w] = labelend[b] = p
+                bestedge[w] = bestedge[b] = -1
+                if t == 1:
+                    queue.extend(blossomLeaves(b))
+                    return
+                # A T-blossom labels the mate of its base with S
                 base = blossombase[b]
-                assignLabel(mate[base], 1, base)
+                assert mate[base] >= 0
+                w, t, p = endpoint[mate[base]], 1, mate[base] ^ 1
 
         def scanBlossom(v, w):
             """
-            Scan the blossom to find the base node.
-
-            Parameters
-            ----------
-            v : node
-                The first node.
-            w : node
-                The second node.
-
-            Returns
-            -------
-            node
-                The base node of the blossom.
+            Traces back from S-vertices v and w to find a new blossom or an augmenting path.
+
+            Returns the base of the new blossom, or -1 for an augmenting path.
             """
             path = []
-            base = NoNode
-            while v is not NoNode:
+            base = -1
+            while v != -1 or w != -1:
                 b = inblossom[v]
                 if label[b] & 4:
                     base = blossombase[b]
@@ -223,173 +176,141 @@ class Solver_Blossom(Solver):
                 assert label[b] == 1
                 path.append(b)
                 label[b] = 5
-                if labeledge[b] is None:
-                    v = NoNode
+                if labelend[b] == -1:
+                    v = -1
                 else:
-                    v = labeledge[b][0]
+                    v = endpoint[labelend[b]]
                     b = inblossom[v]
                     assert label[b] == 2
-                    v = labeledge[b][0]
-                if w is not NoNode:
+                    v = endpoint[labelend[b]]
+                if w != -1:
                     v, w = w, v
             for b in path:
                 label[b] = 1
             return base
 
-        def addBlossom(base, v, w):
+        def addBlossom(base, k):
             """
-            Add a new blossom to the structure.
-
-            Parameters
-            ----------
-            base : node
-                The base node of the blossom.
-            v : node
-                The first node in the blossom.
-            w : node
-                The second node in the blossom.
+            Builds a new blossom with the given base, through the S-S edge k.
             """
+            v, w, _ = edges[k]
             bb = inblossom[base]
             bv = inblossom[v]
             bw = inblossom[w]
-            b = Blossom()
+            b = unusedblossoms.pop()
             blossombase[b] = base
-            blossomparent[b] = None
+            blossomparent[b] = -1
             blossomparent[bb] = b
-            b.childs = path = []
-            b.edges = edgs = [(v, w)]
+            blossomchilds[b] = path = []
+            blossomendps[b] = endps = []
             while bv != bb:
                 blossomparent[bv] = b
                 path.append(bv)
-                edgs.append(labeledge[bv])
-                v = labeledge[bv][0]
+                endps.append(labelend[bv])
+                v = endpoint[labelend[bv]]
                 bv = inblossom[v]
             path.append(bb)
             path.reverse()
-            edgs.reverse()
+            endps.reverse()
+            endps.append(2 * k)
             while bw != bb:
                 blossomparent[bw] = b
                 path.append(bw)
-                edgs.append((labeledge[bw][1], labeledge[bw][0]))
-                w = labeledge[bw][0]
+                endps.append(labelend[bw] ^ 1)
+                w = endpoint[labelend[bw]]
                 bw = inblossom[w]
             label[b] = 1
-            labeledge[b] = labeledge[bb]
-            blossomdual[b] = 0
-            for v in b.leaves():
+            labelend[b] = labelend[bb]
+            dualvar[b] = 0
+            for v in blossomLeaves(b):
                 if label[inblossom[v]] == 2:
                     queue.append(v)
                 inblossom[v] = b
+
+            # Least-slack edges from the new blossom to the other S-blossoms
             bestedgeto = {}
             for bv in path:
-                if isinstance(bv, Blossom):
-                    if bv.mybestedges is not None:
-                        nblist = bv.mybestedges
-                        bv.mybestedges = None
-                    else:
-                        nblist = [
-                            (v, w) for v in bv.leaves() for w in G.neighbors(v) if v != w
-                        ]
+                if blossombestedges[bv] is None:
+                    nblist = [p // 2 for v in blossomLeaves(bv) for p in neighbend[v]]
                 else:
-                    nblist = [(bv, w) for w in G.neighbors(bv) if bv != w]
+                    nblist = blossombestedges[bv]
                 for k in nblist:
-                    (i, j) = k
+                    i, j, _ = edges[k]
                     if inblossom[j] == b:
                         i, j = j, i
                     bj = inblossom[j]
-                    if (
-                        bj != b
-                        and label.get(bj) == 1
-                        and ((bj not in bestedgeto) or slack(i, j) < slack(*bestedgeto[bj]))
-                    ):
+                    if bj != b and label[bj] == 1 and (bj not in bestedgeto or slack(k) < slack(bestedgeto[bj])):
                         bestedgeto[bj] = k
-                bestedge[bv] = None
-            b.mybestedges = list(bestedgeto.values())
-            mybestedge = None
-            bestedge[b] = None
-            for k in b.mybestedges:
-                kslack = slack(*k)
-                if mybestedge is None or kslack < mybestslack:
-                    mybestedge = k
-                    mybestslack = kslack
-            bestedge[b] = mybestedge
+                blossombestedges[bv] = None
+                bestedge[bv] = -1
+            blossombestedges[b] = list(bestedgeto.values())
+            bestedge[b] = -1
+            for k in blossombestedges[b]:
+                if bestedge[b] == -1 or slack(k) < slack(bestedge[b]):
+                    bestedge[b] = k
 
         def expandBlossom(b, endstage):
             """
-            Expand a blossom and update the structure.
-
-            Parameters
-            ----------
-            b : Blossom
-                The blossom to expand.
-            endstage : bool
-                Whether it is the end stage of the algorithm.
+            Expands blossom b into its sub-blossoms, recursively for zero-dual blossoms at the end of a stage.
             """
             def _recurse(b, endstage):
-                for s in b.childs:
-                    blossomparent[s] = None
-                    if isinstance(s, Blossom):
-                        if endstage and blossomdual[s] == 0:
-                            yield s
-                        else:
-                            for v in s.leaves():
-                                inblossom[v] = s
-                    else:
+                for s in blossomchilds[b]:
+                    blossomparent[s] = -1
+                    if s < nvertex:
                         inblossom[s] = s
-                if (not endstage) and label.get(b) == 2:
-                    entrychild = inblossom[labeledge[b][1]]
-                    j = b.childs.index(entrychild)
+                    elif endstage and dualvar[s] == 0:
+                        yield s
+                    else:
+                        for v in blossomLeaves(s):
+                            inblossom[v] = s
+                if (not endstage) and label[b] == 2:
+                    # Relabel the sub-blossoms on the even path from the entry child to the base
+                    entrychild = inblossom[endpoint[labelend[b] ^ 1]]
+                    j = blossomchilds[b].index(entrychild)
                     if j & 1:
-                        j -= len(b.childs)
+                        j -= len(blossomchilds[b])
                         jstep = 1
+                        endptrick = 0
                     else:
                         jstep = -1
-                    v, w = labeledge[b]
+                        endptrick = 1
+                    p = labelend[b]
                     while j != 0:
-                        if jstep == 1:
-                            p, q = b.edges[j]
-                        else:
-                            q, p = b.edges[j - 1]
-                        label[w] = None
-                        label[q] = None
-                        assignLabel(w, 2, v)
-                        allowedge[(p, q)] = allowedge[(q, p)] = True
+                        label[endpoint[p ^ 1]] = 0
+                        label[endpoint[blossomendps[b][j - endptrick] ^ endptrick ^ 1]] = 0
+                        assignLabel(endpoint[p ^ 1], 2, p)
+                        allowedge[blossomendps[b][j - endptrick] // 2] = True
                         j += jstep
-                        if jstep == 1:
-                            v, w = b.edges[j]
-                        else:
-                            w, v = b.edges[j - 1]
-                        allowedge[(v, w)] = allowedge[(w, v)] = True
+                        p = blossomendps[b][j - endptrick] ^ endptrick
+                        allowedge[p // 2] = True
                         j += jstep
-                    bw = b.childs[j]
-                    label[w] = label[bw] = 2
-                    labeledge[w] = labeledge[bw] = (v, w)
-                    bestedge[bw] = None
+                    bv = blossomchilds[b][j]
+                    label[endpoint[p ^ 1]] = label[bv] = 2
+                    labelend[endpoint[p ^ 1]] = labelend[bv] = p
+                    bestedge[bv] = -1
                     j += jstep
-                    while b.childs[j] != entrychild:
-                        bv = b.childs[j]
-                        if label.get(bv) == 1:
+                    # The sub-blossoms on the odd path become free or reachable T-blossoms
+                    while blossomchilds[b][j] != entrychild:
+                        bv = blossomchilds[b][j]
+                        if label[bv] == 1:
                             j += jstep
                             continue
-                        if isinstance(bv, Blossom):
-                            for v in bv.leaves():
-                                if label.get(v):
-                                    break
-                        else:
-                            v = bv
-                        if label.get(v):
+                        for v in blossomLeaves(bv):
+                            if label[v] != 0:
+                                break
+                        if label[v] != 0:
                             assert label[v] == 2
                             assert inblossom[v] == bv
-                            label[v] = None
-                            label[mate[blossombase[bv]]] = None
-                            assignLabel(v, 2, labeledge[v][0])
+                            label[v] = 0
+                            label[endpoint[mate[blossombase[bv]]]] = 0
+                            assignLabel(v, 2, labelend[v])
                         j += jstep
-                label.pop(b, None)
-                labeledge.pop(b, None)
-                bestedge.pop(b, None)
-                del blossomparent[b]
-                del blossombase[b]
-                del blossomdual[b]
+                label[b] = labelend[b] = -1
+                blossomchilds[b] = blossomendps[b] = None
+                blossombase[b] = -1
+                blossombestedges[b] = None
+                bestedge[b] = -1
+                unusedblossoms.append(b)
 
             stack = [_recurse(b, endstage)]
             while stack:
@@ -402,43 +323,37 @@ class Solver_Blossom(Solver):
 
         def augmentBlossom(b, v):
             """
-            Augment the matching within a blossom.
-
-            Parameters
-            ----------
-            b : Blossom
-                The blossom to augment.
-            v : node
-                The node to start augmentation from.
+            Swaps matched and unmatched edges inside blossom b so that vertex v becomes its base.
             """
             def _recurse(b, v):
                 t = v
                 while blossomparent[t] != b:
                     t = blossomparent[t]
-                i = j = b.childs.index(t)
+                if t >= nvertex:
+                    yield (t, v)
+                i = j = blossomchilds[b].index(t)
                 if i & 1:
-                    j -= len(b.childs)
+                    j -= len(blossomchilds[b])
                     jstep = 1
+                    endptrick = 0
                 else:
                     jstep = -1
+                    endptrick = 1
                 while j != 0:
                     j += jstep
-                    t = b.childs[j]
-                    if jstep == 1:
-                        w, x = b.edges[j]
-                    else:
-                        x, w = b.edges[j - 1]
-                    if isinstance(t, Blossom):
-                        yield (t, w)
+                    t = blossomchilds[b][j]
+                    p = blossomendps[b][j - endptrick] ^ endptrick
+                    if t >= nvertex:
+                        yield (t, endpoint[p])
                     j += jstep
-                    t = b.childs[j]
-                    if isinstance(t, Blossom):
-                        yield (t, x)
-                    mate[w] = x
-                    mate[x] = w
-                b.childs = b.childs[i:] + b.childs[:i]
-                b.edges = b.edges[i:] + b.edges[:i]
-                blossombase[b] = blossombase[b.childs[0]]
+                    t = blossomchilds[b][j]
+                    if t >= nvertex:
+                        yield (t, endpoint[p ^ 1])
+                    mate[endpoint[p]] = p ^ 1
+                    mate[endpoint[p ^ 1]] = p
+                blossomchilds[b] = blossomchilds[b][i:] + blossomchilds[b][:i]
+                blossomendps[b] = blossomendps[b][i:] + blossomendps[b][:i]
+                blossombase[b] = blossombase[blossomchilds[b][0]]
                 assert blossombase[b] == v
 
             stack = [_recurse(b, v)]
@@ -450,198 +365,185 @@ class Solver_Blossom(Solver):
                 else:
                     stack.pop()
 
-        def augmentMatching(v, w):
+        def augmentMatching(k):
             """
-            Augment the matching by alternating paths.
-
-            Parameters
-            ----------
-            v : node
-                The first node in the augmenting path.
-            w : node
-                The second node in the augmenting path.
+            Augments the matching along the path through the S-S edge k.
             """
-            for s, j in ((v, w), (w, v)):
-                while 1:
+            v, w, _ = edges[k]
+            for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+                while True:
                     bs = inblossom[s]
                     assert label[bs] == 1
-                    assert (labeledge[bs] is None and blossombase[bs] not in mate) or (
-                        labeledge[bs][0] == mate[blossombase[bs]]
-                    )
-                    if isinstance(bs, Blossom):
+                    if bs >= nvertex:
                         augmentBlossom(bs, s)
-                    mate[s] = j
-                    if labeledge[bs] is None:
+                    mate[s] = p
+                    if labelend[bs] == -1:
                         break
-                    t = labeledge[bs][0]
+                    t = endpoint[labelend[bs]]
                     bt = inblossom[t]
                     assert label[bt] == 2
-                    s, j = labeledge[bt]
+                    s = endpoint[labelend[bt]]
+                    j = endpoint[labelend[bt] ^ 1]
                     assert blossombase[bt] == t
-                    if isinstance(bt, Blossom):
+                    if bt >= nvertex:
                         augmentBlossom(bt, j)
-                    mate[j] = s
+                    mate[j] = labelend[bt]
+                    p = labelend[bt] ^ 1
 
         def verifyOptimum():
             """
             Verify that the computed matching is optimal.
             """
             if maxcardinality:
-                vdualoffset = max(0, -min(dualvar.values()))
+                vdualoffset = max(0, -min(dualvar[:nvertex]))
             else:
                 vdualoffset = 0
-            assert min(dualvar.values()) + vdualoffset >= 0
-            assert len(blossomdual) == 0 or min(blossomdual.values()) >= 0
-            for i, j, d in G.edges(data=True):
-                wt = d.get(weight, 1)
-                if i == j:
-                    continue
+            assert min(dualvar[:nvertex]) + vdualoffset >= 0
+            assert min(dualvar[nvertex:]) >= 0
+            for k, (i, j, wt) in enumerate(edges):
                 s = dualvar[i] + dualvar[j] - 2 * wt
                 iblossoms = [i]
                 jblossoms = [j]
-                while blossomparent[iblossoms[-1]] is not None:
+                while blossomparent[iblossoms[-1]] != -1:
                     iblossoms.append(blossomparent[iblossoms[-1]])
-                while blossomparent[jblossoms[-1]] is not None:
+                while blossomparent[jblossoms[-1]] != -1:
                     jblossoms.append(blossomparent[jblossoms[-1]])
                 iblossoms.reverse()
                 jblossoms.reverse()
                 for bi, bj in zip(iblossoms, jblossoms):
                     if bi != bj:
                         break
-                    s += 2 * blossomdual[bi]
+                    s += 2 * dualvar[bi]
                 assert s >= 0
-                if mate.get(i) == j or mate.get(j) == i:
-                    assert mate[i] == j and mate[j] == i
+                if mate[i] // 2 == k or mate[j] // 2 == k:
+                    assert mate[i] // 2 == k and mate[j] // 2 == k
                     assert s == 0
-            for v in gnodes:
-                assert (v in mate) or dualvar[v] + vdualoffset == 0
-            for b in blossomdual:
-                if blossomdual[b] > 0:
-                    assert len(b.edges) % 2 == 1
-                    for i, j in b.edges[1::2]:
-                        assert mate[i] == j and mate[j] == i
-
-        while 1:
-            label.clear()
-            labeledge.clear()
-            bestedge.clear()
-            for b in blossomdual:
-                b.mybestedges = None
-            allowedge.clear()
+            for v in range(nvertex):
+                assert mate[v] >= 0 or dualvar[v] + vdualoffset == 0
+            for b in range(nvertex, 2 * nvertex):
+                if blossombase[b] >= 0 and dualvar[b] > 0:
+                    assert len(blossomendps[b]) % 2 == 1
+                    for p in blossomendps[b][1::2]:
+                        assert mate[endpoint[p]] == p ^ 1
+                        assert mate[endpoint[p ^ 1]] == p
+
+        # Each stage augments the matching once, or stops when no augmentation is possible
+        for _ in range(nvertex):
+            label[:] = [0] * (2 * nvertex)
+            bestedge[:] = [-1] * (2 * nvertex)
+            blossombestedges[nvertex:] = [None] * nvertex
+            allowedge[:] = [False] * nedge
             queue[:] = []
-            for v in gnodes:
-                if (v not in mate) and label.get(inblossom[v]) is None:
-                    assignLabel(v, 1, None)
-            augmented = 0
-            while 1:
+            for v in range(nvertex):
+                if mate[v] == -1 and label[inblossom[v]] == 0:
+                    assignLabel(v, 1, -1)
+            augmented = False
+            while True:
+                # Grow the alternating forest along tight edges
                 while queue and not augmented:
                     v = queue.pop()
                     assert label[inblossom[v]] == 1
-                    for w in G.neighbors(v):
-                        if w == v:
-                            continue
-                        bv = inblossom[v]
-                        bw = inblossom[w]
-                        if bv == bw:
+                    for p in neighbend[v]:
+                        k = p // 2
+                        w = endpoint[p]
+                        if inblossom[v] == inblossom[w]:
                             continue
-                        if (v, w) not in allowedge:
-                            kslack = slack(v, w)
+                        if not allowedge[k]:
+                            kslack = slack(k)
                             if kslack <= 0:
-                                allowedge[(v, w)] = allowedge[(w, v)] = True
-                        if (v, w) in allowedge:
-                            if label.get(bw) is None:
-                                assignLabel(w, 2, v)
-                            elif label.get(bw) == 1:
+                                allowedge[k] = True
+                        if allowedge[k]:
+                            if label[inblossom[w]] == 0:
+                                assignLabel(w, 2, p ^ 1)
+                            elif label[inblossom[w]] == 1:
                                 base = scanBlossom(v, w)
-                                if base is not NoNode:
-                                    addBlossom(base, v, w)
+                                if base >= 0:
+                                    addBlossom(base, k)
                                 else:
-                                    augmentMatching(v, w)
-                                    augmented = 1
+                                    augmentMatching(k)
+                                    augmented = True
                                     break
-                            elif label.get(w) is None:
-                                assert label[bw] == 2
+                            elif label[w] == 0:
+                                assert label[inblossom[w]] == 2
                                 label[w] = 2
-                                labeledge[w] = (v, w)
-                        elif label.get(bw) == 1:
-                            if bestedge.get(bv) is None or kslack < slack(*bestedge[bv]):
-                                bestedge[bv] = (v, w)
-                        elif label.get(w) is None:
-                            if bestedge.get(w) is None or kslack < slack(*bestedge[w]):
-                                bestedge[w] = (v, w)
+                                labelend[w] = p ^ 1
+                        elif label[inblossom[w]] == 1:
+                            b = inblossom[v]
+                            if bestedge[b] == -1 or kslack < slack(bestedge[b]):
+                                bestedge[b] = k
+                        elif label[w] == 0:
+                            if bestedge[w] == -1 or kslack < slack(bestedge[w]):
+                                bestedge[w] = k
                 if augmented:
                     break
+
+                # No augmenting path on tight edges: update the dual variables
                 deltatype = -1
                 delta = deltaedge = deltablossom = None
                 if not maxcardinality:
                     deltatype = 1
-                    delta = min(dualvar.values())
-                for v in G.nodes():
-                    if label.get(inblossom[v]) is None and bestedge.get(v) is not None:
-                        d = slack(*bestedge[v])
+                    delta = min(dualvar[:nvertex])
+                for v in range(nvertex):
+                    if label[inblossom[v]] == 0 and bestedge[v] != -1:
+                        d = slack(bestedge[v])
                         if deltatype == -1 or d < delta:
                             delta = d
                             deltatype = 2
                             deltaedge = bestedge[v]
-                for b in blossomparent:
-                    if (
-                        blossomparent[b] is None
-                        and label.get(b) == 1
-                        and bestedge.get(b) is not None
-                    ):
-                        kslack = slack(*bestedge[b])
-                        if allinteger:
-                            d = kslack // 2
-                        else:
-                            d = kslack / 2.0
+                for b in range(2 * nvertex):
+                    if blossomparent[b] == -1 and label[b] == 1 and bestedge[b] != -1:
+                        kslack = slack(bestedge[b])
+                        d = kslack // 2 if allinteger else kslack / 2.0
                         if deltatype == -1 or d < delta:
                             delta = d
                             deltatype = 3
                             deltaedge = bestedge[b]
-                for b in blossomdual:
-                    if (
-                        blossomparent[b] is None
-                        and label.get(b) == 2
-                        and (deltatype == -1 or blossomdual[b] < delta)
-                    ):
-                        delta = blossomdual[b]
+                for b in range(nvertex, 2 * nvertex):
+                    if (blossombase[b] >= 0 and blossomparent[b] == -1 and label[b] == 2
+                            and (deltatype == -1 or dualvar[b] < delta)):
+                        delta = dualvar[b]
                         deltatype = 4
                         deltablossom = b
                 if deltatype == -1:
                     deltatype = 1
-                    delta = max(0, min(dualvar.values()))
-                for v in gnodes:
-                    if label.get(inblossom[v]) == 1:
+                    delta = max(0, min(dualvar[:nvertex]))
+
+                for v in range(nvertex):
+                    if label[inblossom[v]] == 1:
                         dualvar[v] -= delta
-                    elif label.get(inblossom[v]) == 2:
+                    elif label[inblossom[v]] == 2:
                         dualvar[v] += delta
-                for b in blossomdual:
-                    if blossomparent[b] is None:
-                        if label.get(b) == 1:
-                            blossomdual[b] += delta
-                        elif label.get(b) == 2:
-                            blossomdual[b] -= delta
+                for b in range(nvertex, 2 * nvertex):
+                    if blossombase[b] >= 0 and blossomparent[b] == -1:
+                        if label[b] == 1:
+                            dualvar[b] += delta
+                        elif label[b] == 2:
+                            dualvar[b] -= delta
+
                 if deltatype == 1:
                     break
                 elif deltatype == 2:
-                    (v, w) = deltaedge
-                    allowedge[(v, w)] = allowedge[(w, v)] = True
-                    queue.append(v)
+                    allowedge[deltaedge] = True
+                    i, j, _ = edges[deltaedge]
+                    if label[inblossom[i]] == 0:
+                        i, j = j, i
+                    assert label[inblossom[i]] == 1
+                    queue.append(i)
                 elif deltatype == 3:
-                    (v, w) = deltaedge
-                    allowedge[(v, w)] = allowedge[(w, v)] = True
-                    queue.append(v)
+                    allowedge[deltaedge] = True
+                    i, j, _ = edges[deltaedge]
+                    assert label[inblossom[i]] == 1
+                    queue.append(i)
                 elif deltatype == 4:
                     expandBlossom(deltablossom, False)
-            for v in mate:
-                assert mate[mate[v]] == v
+
             if not augmented:
                 break
-            for b in list(blossomdual.keys()):
-                if b not in blossomdual:
-                    continue
-                if blossomparent[b] is None and label.get(b) == 1 and blossomdual[b] == 0:
+            # Expand the S-blossoms whose dual variable dropped to zero
+            for b in range(nvertex, 2 * nvertex):
+                if blossomparent[b] == -1 and blossombase[b] >= 0 and label[b] == 1 and dualvar[b] == 0:
                     expandBlossom(b, True)
-        if allinteger:
+
+        if verify_optimum and allinteger:
             verifyOptimum()
-        return Solver_Blossom.matching_dict_to_set(mate)
+        return [endpoint[p] if p >= 0 else -1 for p in mate]
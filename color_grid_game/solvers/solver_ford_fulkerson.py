@@ -8,17 +8,41 @@ from color_grid_game import *
 class Solver_Ford_Fulkerson(Solver):
     """
     A subclass of Solver that implements a bipartite matching algorithm to find pairs.
+
+    Attributes
+    ----------
+    methods : tuple[str]
+        The available matching engines: "edmonds_karp" (one BFS per augmenting path on
+        the flow network) and "hopcroft_karp" (shortest augmenting paths by phases on
+        integer adjacency arrays).
     """
 
-    def run(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    methods = ("edmonds_karp", "hopcroft_karp")
+
+    def run(self, method: str = "edmonds_karp") -> list[tuple[tuple[int, int], tuple[int, int]]]:
         """
         Runs the bipartite matching algorithm to find pairs of cells.
 
+        Parameters
+        ----------
+        method : str, optional
+            The matching engine, one of `Solver_Ford_Fulkerson.methods`. Default is "edmonds_karp".
+
         Returns
         -------
         list of tuple
             A list of pairs of cells, each represented as a tuple of tuples.
+
+        Raises
+        ------
+        ValueError
+            If the method is not recognized.
         """
+        if method not in self.methods:
+            raise ValueError(f"Unknown method {method!r}, expected one of {self.methods}.")
+        if method == "hopcroft_karp":
+            return self._run_hopcroft_karp()
+
         graph = defaultdict(list)
         even_cells = set()
         odd_cells = set()
@@ -45,6 +69,112 @@ class Solver_Ford_Fulkerson(Solver):
         self.pairs = self.edmonds_karp(graph, even_cells, odd_cells)
         return self.pairs
 
+    def _run_hopcroft_karp(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Runs the Hopcroft-Karp engine on the same bipartite graph as the flow network.
+
+        Returns
+        -------
+        list of tuple
+            A list of pairs (even cell, odd cell).
+        """
+        src, dst, _ = self.grid.edges(self.rules)
+        size = self.grid.n * self.grid.m
+
+        # Orient the edges from even to odd cells, as in the flow network
+        src_is_even = (src // self.grid.m + src % self.grid.m) % 2 == 0
+        even = np.where(src_is_even, src, dst)
+        odd = np.where(src_is_even, dst, src)
+        order = np.argsort(even, kind="stable")
+        adjacency = odd[order].tolist()
+        pointers = np.searchsorted(even[order], np.arange(size + 1)).tolist()
+
+        cells = self.grid.cells(np.arange(size))
+        self.even_cells = set(self.grid.cells(np.unique(even)))
+        self.odd_cells = set(self.grid.cells(np.unique(odd)))
+        mate = self.hopcroft_karp(adjacency, pointers, size)
+        self.pairs = [(cells[u], cells[v]) for u, v in enumerate(mate) if v != -1]
+        return self.pairs
+
+    @staticmethod
+    def hopcroft_karp(adjacency: list[int], pointers: list[int], n_right: int) -> list[int]:
+        """
+        Computes a maximum matching of a bipartite graph with the Hopcroft-Karp algorithm.
+
+        Each phase finds the length of the shortest augmenting paths with a BFS from all the
+        free left vertices, then augments along a maximal set of vertex-disjoint shortest
+        paths with depth-first searches.
+
+        Parameters
+        ----------
+        adjacency : list[int]
+            Neighbours of the left vertices, the neighbours of u being
+            `adjacency[pointers[u]:pointers[u + 1]]`.
+        pointers : list[int]
+            Offsets of each left vertex in `adjacency` (length: number of left vertices + 1).
+        n_right : int
+            The number of right vertices.
+
+        Returns
+        -------
+        list[int]
+            For each left vertex, the right vertex it is matched with, or -1.
+
+        Time Complexity: O(E * sqrt(V))
+        """
+        n_left = len(pointers) - 1
+        mate_left = [-1] * n_left
+        mate_right = [-1] * n_right
+
+        while True:
+            # Layer the left vertices by their distance to a free left vertex
+            dist = [-1] * n_left
+            queue = deque()
+            for u in range(n_left):
+                if mate_left[u] == -1 and pointers[u] != pointers[u + 1]:
+                    dist[u] = 0
+                    queue.append(u)
+            shortest = -1
+            while queue:
+                u = queue.popleft()
+                if shortest != -1 and dist[u] >= shortest:
+                    continue
+                for k in range(pointers[u], pointers[u + 1]):
+                    w = mate_right[adjacency[k]]
+                    if w == -1:
+                        if shortest == -1:
+                            shortest = dist[u] + 1
+                    elif dist[w] == -1:
+                        dist[w] = dist[u] + 1
+                        queue.append(w)
+            if shortest == -1:
+                return mate_left
+
+            # Augment along vertex-disjoint shortest paths, following the layers
+            position = pointers[:-1]
+            for root in range(n_left):
+                if dist[root] != 0 or mate_left[root] != -1:
+                    continue
+                stack = [root]
+                while stack:
+                    u = stack[-1]
+                    if position[u] == pointers[u + 1]:
+                        dist[u] = -1
+                        stack.pop()
+                        continue
+                    v = adjacency[position[u]]
+                    position[u] += 1
+                    w = mate_right[v]
+                    if w == -1:
+                        if dist[u] + 1 == shortest:
+                            for x in reversed(stack):
+                                mate_left[x], mate_right[v], v = v, x, mate_left[x]
+                            for x in stack:
+                                dist[x] = -1
+                            break
+                    elif dist[w] == dist[u] + 1:
+                        stack.append(w)
+
     @staticmethod
     def bfs(graph: dict, s: str, t: str) -> dict:
         """
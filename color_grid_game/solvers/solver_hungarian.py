@@ -1,5 +1,6 @@
 import sys
 import os
+import heapq
 import numpy as np
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -12,8 +13,11 @@ class Solver_Hungarian(Solver):
 
     def run(self):
         """
-        Builds a bipartite cost matrix using only cells present in valid pairs.
-        Applies the Hungarian algorithm to find optimal pairs.
+        Finds optimal pairs with the Hungarian (primal-dual) method.
+
+        Under the original rules the pairs form a sparse bipartite graph (even and odd
+        cells) solved by `sparse_assignment`. Under the new rules a square cost matrix
+        of the cells present in valid pairs is solved by `hungarian_algorithm`.
 
         Returns
         -------
@@ -25,69 +29,325 @@ class Solver_Hungarian(Solver):
         ValueError
             If the cost matrix is empty or if pairs are invalid.
         """
-        pairs = self.grid.all_pairs(self.rules)  # O(P) where P is the number of pairs
-        all_cells = list(set(cell for pair in pairs for cell in pair)) 
+        flat_value = self.grid.to_arrays()[1].ravel().astype(np.int64)
 
         if self.rules == "original rules":
-            even_cells = []
-            odd_cells = []
-            for cell in all_cells:  
-                if (cell[0] + cell[1]) % 2 == 0:
-                    even_cells.append(cell)
-                else:
-                    odd_cells.append(cell)
+            src, dst, cost = self.grid.edges(self.rules)  # O(P) where P is the number of pairs
+            gain = flat_value[src] + flat_value[dst] - cost
+            size = self.grid.n * self.grid.m
+
+            # Orient every pair from its even cell to its odd cell, as a sparse (CSR) bipartite graph
+            src_rows, src_cols = divmod(src, self.grid.m)
+            src_is_even = (src_rows + src_cols) % 2 == 0
+            u = np.where(src_is_even, src, dst)
+            v = np.where(src_is_even, dst, src)
+            order = np.argsort(u, kind="stable")
+            pointers = np.searchsorted(u[order], np.arange(size + 1))
+
+            # Only the real grid edges are used, no padded square matrix
+            mate, (dual_left, dual_right) = self.sparse_assignment(v[order].tolist(), pointers.tolist(),
+                                                                   gain[order].tolist(), size, return_duals=True)  # O(K * P log P)
+
+            # Matching and duals over cell ids, kept to repair the solution after removals
+            both = np.concatenate((u, v))
+            order = np.argsort(both, kind="stable")
+            self._adjacency = np.concatenate((v, u))[order].tolist()
+            self._gains = np.concatenate((gain, gain))[order].tolist()
+            self._pointers = np.searchsorted(both[order], np.arange(size + 1)).tolist()
+            rows, cols = divmod(np.arange(size), self.grid.m)
+            self._dual = np.where((rows + cols) % 2 == 0, dual_left, dual_right).tolist()
+            self._mate = [-1] * size
+            for even, odd in enumerate(mate):
+                if odd != -1:
+                    self._mate[even], self._mate[odd] = odd, even
+            self._blocked = [False] * size
+            self._cells = self.grid.cells(np.arange(size))
+            self._even = np.flatnonzero((rows + cols) % 2 == 0).tolist()
+
+            self.pairs = [(self._cells[even], self._cells[odd]) for even, odd in enumerate(mate) if odd != -1]
 
-            # Create mappings for matrix indices
-            even_to_idx = {cell: i for i, cell in enumerate(even_cells)}  
-            odd_to_idx = {cell: j for j, cell in enumerate(odd_cells)}  
+        elif self.rules == "new rules":
+            # White pairs are filled block-wise from the pair set instead of being listed
+            pair_set = PairSet(self.grid, self.rules)
+            all_cells = np.flatnonzero(pair_set.degrees() > 0)
+            num_cells = len(all_cells)
+            cost_matrix = np.zeros((num_cells, num_cells))
+            src, dst = pair_set.adjacent_src, pair_set.adjacent_dst
+            weight = -2 * np.minimum(flat_value[src], flat_value[dst])
+            cost_matrix[np.searchsorted(all_cells, src), np.searchsorted(all_cells, dst)] = weight
+            rows = np.searchsorted(all_cells, pair_set.whites)
+            cols = np.searchsorted(all_cells, pair_set.playable)
+            cost_matrix[np.ix_(rows, cols)] = -2 * np.minimum.outer(flat_value[pair_set.whites],
+                                                                      flat_value[pair_set.playable])
+            cost_matrix[rows, rows] = 0
 
-            # Build cost matrix with valid pairs only and pad to square
-            even_count = len(even_cells)
-            odd_count = len(odd_cells)
-            max_dim = max(even_count, odd_count)
-            cost_matrix = np.zeros((max_dim, max_dim))
+            # Apply Hungarian algorithm on the square matrix
+            row_ind, col_ind = self.hungarian_algorithm(cost_matrix)  # O(C^3)
 
-            for u, v in pairs:
+            # Rebuild pairs from matrix indices, filtering valid entries
+            keep = cost_matrix[row_ind, col_ind] != 0
+            self.pairs = list(zip(self.grid.cells(all_cells[row_ind[keep]]),
+                                  self.grid.cells(all_cells[col_ind[keep]])))
 
-                if (u[0] + u[1]) % 2 != 0:
-                    u, v = v, u
-                if u in even_to_idx and v in odd_to_idx:
-                    cost = self.grid.cost((u, v)) 
-                    weight = cost - self.grid.value[u[0]][u[1]] - self.grid.value[v[0]][v[1]]  
-                    cost_matrix[even_to_idx[u], odd_to_idx[v]] = weight 
+        return self.pairs
 
-            # Apply Hungarian algorithm on the padded square matrix
-            row_ind, col_ind = self.hungarian_algorithm(cost_matrix)  # O(max_dim^3)
+    def remove_cells(self, cells) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Removes cells from the problem and repairs the optimal pairs with a few augmentations.
 
-            # Rebuild pairs from matrix indices, filtering valid entries
-            self.pairs = []
-            for i, j in zip(row_ind, col_ind):  # O(max_dim)
-                if i < even_count and j < odd_count and cost_matrix[i][j] != 0:
-                    self.pairs.append((even_cells[i], odd_cells[j]))  
+        Under the original rules, after `run()`, the previous matching and its dual values
+        are kept: each cell losing its partner is the root of one primal-dual search
+        (`_repair`), which stays local to the removed cells. Otherwise the pairs are solved
+        again from scratch.
 
-        elif self.rules == "new rules":
-            num_cells = len(all_cells) 
-            cost_matrix = np.zeros((num_cells, num_cells))  
+        Parameters
+        ----------
+        cells : iterable of tuple[int, int]
+            The cells to remove.
 
-            # Create a mapping from cell to matrix index
-            cell_to_idx = {cell: i for i, cell in enumerate(all_cells)}
+        Returns
+        -------
+        list of tuple
+            The fixed pairs followed by the optimized pairs of the remaining cells, also stored in self.pairs.
 
-            for u, v in pairs: 
-                if u in cell_to_idx and v in cell_to_idx:
-                    cost = self.grid.cost((u, v)) 
-                    weight = cost - self.grid.value[u[0]][u[1]] - self.grid.value[v[0]][v[1]] 
-                    cost_matrix[cell_to_idx[u], cell_to_idx[v]] = weight
+        Raises
+        ------
+        IndexError
+            If a cell is out of the grid boundaries.
+        """
+        if self.rules != "original rules" or getattr(self, "_mate", None) is None:
+            return super().remove_cells(cells)
+
+        roots = []
+        for i, j in cells:
+            if not self.grid._is_within_bounds(i, j):
+                raise IndexError("Cell index out of grid boundaries.")
+            x = i * self.grid.m + j
+            self.removed.add((i, j))
+            if self._blocked[x]:
+                continue
+            self._blocked[x] = True
+            partner = self._mate[x]
+            if partner != -1:
+                self._mate[x] = self._mate[partner] = -1
+                roots.append(partner)
+        for root in roots:
+            if not self._blocked[root]:
+                self._repair(root)
+
+        mate, cells = self._mate, self._cells
+        self.pairs = self.fixed_pairs + [(cells[x], cells[mate[x]]) for x in self._even if mate[x] != -1]
+        return self.pairs
 
-            # Apply Hungarian algorithm on the square matrix
-            row_ind, col_ind = self.hungarian_algorithm(cost_matrix)  # O(C^3)
+    def _repair(self, root: int) -> None:
+        """
+        Restores the optimality of the matching after vertex `root` lost its partner.
 
-            # Rebuild pairs from matrix indices, filtering valid entries
-            self.pairs = []
-            for i, j in zip(row_ind, col_ind):
-                if cost_matrix[i][j] != 0:
-                    self.pairs.append((all_cells[i], all_cells[j]))
+        The free vertex keeps a positive dual value, which the Hungarian method lowers with a
+        Dijkstra search over the slacks of an alternating tree rooted at it. The search stops
+        when it reaches a free vertex (augmentation), or when the dual value of the root
+        (it stays free) or of another vertex of its side (it is freed) reaches zero.
 
-        return self.pairs
+        Parameters
+        ----------
+        root : int
+            The id of the unmatched vertex.
+        """
+        adjacency, pointers, gains = self._adjacency, self._pointers, self._gains
+        mate, dual, blocked = self._mate, self._dual, self._blocked
+        if dual[root] == 0:
+            return
+
+        inf = float('inf')
+        # Tree vertices on the side of the root (distance at which they joined) and on the other side
+        inner = {root: 0}
+        outer = {}
+        parent = {}
+        settled = set()
+        # Heap items (key, kind, vertex): kind 0 when the dual value of an inner vertex reaches zero,
+        # kind 1 when an edge to an outer vertex becomes tight
+        heap = [(dual[root], 0, root)]
+
+        def relax(x):
+            d = inner[x] + dual[x]
+            for k in range(pointers[x], pointers[x + 1]):
+                w = adjacency[k]
+                if blocked[w] or w in settled or w == mate[x]:
+                    continue
+                key = d + dual[w] - gains[k]
+                if key < outer.get(w, inf):
+                    outer[w] = key
+                    parent[w] = x
+                    heapq.heappush(heap, (key, 1, w))
+
+        relax(root)
+        while True:
+            delta, kind, x = heapq.heappop(heap)
+            if kind == 0:
+                end = x
+                break
+            if x in settled or delta > outer[x]:
+                continue
+            settled.add(x)
+            if mate[x] == -1:
+                end = x
+                break
+            y = mate[x]
+            inner[y] = delta
+            parent[y] = x
+            heapq.heappush(heap, (delta + dual[y], 0, y))
+            relax(y)
+
+        # Dual update: the inner vertices decrease, the settled outer vertices increase
+        for x, d in inner.items():
+            dual[x] -= max(0, delta - d)
+        for w in settled:
+            dual[w] += max(0, delta - outer[w])
+
+        if end == root:
+            return
+        if kind == 0:
+            # The inner vertex reaching zero is freed, its partner ends the alternating path
+            w = mate[end]
+            mate[end] = mate[w] = -1
+        else:
+            w = end
+        while True:
+            x = parent[w]
+            previous = mate[x]
+            mate[x], mate[w] = w, x
+            if x == root:
+                break
+            w = previous
+
+    @staticmethod
+    def sparse_assignment(adjacency: list[int], pointers: list[int], gains: list[int], n_right: int,
+                          return_duals: bool = False):
+        """
+        Solves the maximum weight bipartite matching problem on a sparse graph.
+
+        This is the primal-dual (Hungarian) method with successive shortest paths: a Dijkstra
+        search on the reduced costs updates the potentials, then a maximal set of
+        augmenting paths is applied on the edges of zero reduced cost. It stops when no
+        augmenting path increases the weight any more, so the matching is not
+        necessarily perfect.
+
+        Parameters
+        ----------
+        adjacency : list[int]
+            Neighbours of the left vertices, the neighbours of u being
+            `adjacency[pointers[u]:pointers[u + 1]]`.
+        pointers : list[int]
+            Offsets of each left vertex in `adjacency` (length: number of left vertices + 1).
+        gains : list[int]
+            The integer weight of each edge, aligned with `adjacency`.
+        n_right : int
+            The number of right vertices.
+        return_duals : bool, optional
+            Whether to also return an optimal dual solution. Default is False.
+
+        Returns
+        -------
+        list[int]
+            For each left vertex, the right vertex it is matched with, or -1.
+        tuple[list[int], list[int]]
+            Only if `return_duals` is set: the dual values y of the left and right vertices,
+            non-negative, with y_u + y_v >= gain on every edge, equality on the matched
+            edges, and zero on the unmatched vertices.
+
+        Time Complexity: O(K * E log V), K being the number of phases (small for small integer gains)
+        """
+        n_left = len(pointers) - 1
+        sink = n_left + n_right
+        inf = float('inf')
+        mate_left = [-1] * n_left
+        mate_right = [-1] * n_right
+        mate_gain = [0] * n_left
+
+        # Potentials: left vertices (and the source) at 0, right vertices below their best incoming gain
+        potential = [0] * (sink + 1)
+        for k, v in enumerate(adjacency):
+            potential[n_left + v] = min(potential[n_left + v], -gains[k])
+        potential[sink] = min(potential[n_left:sink], default=0)
+        roots = [u for u in range(n_left) if pointers[u] != pointers[u + 1]]
+
+        while True:
+            # Dijkstra from the free left vertices on the reduced costs
+            dist = [inf] * (sink + 1)
+            heap = []
+            for u in roots:
+                if mate_left[u] == -1:
+                    dist[u] = 0
+                    heap.append((0, u))
+            while heap:
+                d, x = heapq.heappop(heap)
+                if d > dist[x]:
+                    continue
+                if x == sink:
+                    break
+                if x < n_left:
+                    for k in range(pointers[x], pointers[x + 1]):
+                        v = adjacency[k]
+                        if v == mate_left[x]:
+                            continue
+                        y = n_left + v
+                        nd = d - gains[k] + potential[x] - potential[y]
+                        if nd < dist[y]:
+                            dist[y] = nd
+                            heapq.heappush(heap, (nd, y))
+                else:
+                    u = mate_right[x - n_left]
+                    if u == -1:
+                        y, nd = sink, d + potential[x] - potential[sink]
+                    else:
+                        y, nd = u, d + mate_gain[u] + potential[x] - potential[u]
+                    if nd < dist[y]:
+                        dist[y] = nd
+                        heapq.heappush(heap, (nd, y))
+
+            # Stop when the shortest augmenting path no longer increases the weight
+            bound = dist[sink]
+            if bound == inf or bound + potential[sink] >= 0:
+                if not return_duals:
+                    return mate_left
+                # Raise the potentials until the sink reaches 0: they then give the dual values
+                shift = -potential[sink]
+                for x in range(sink + 1):
+                    potential[x] += min(dist[x], shift)
+                dual_right = [max(0, -p) for p in potential[n_left:sink]]
+                return mate_left, (potential[:n_left], dual_right)
+            for x in range(sink + 1):
+                potential[x] += min(dist[x], bound)
+
+            # Augment along vertex-disjoint paths of zero reduced cost
+            position = pointers[:-1]
+            visited = [False] * n_right
+            for root in roots:
+                if mate_left[root] != -1:
+                    continue
+                stack = [root]
+                while stack:
+                    x = stack[-1]
+                    if position[x] == pointers[x + 1]:
+                        stack.pop()
+                        continue
+                    k = position[x]
+                    position[x] += 1
+                    v = adjacency[k]
+                    y = n_left + v
+                    if visited[v] or v == mate_left[x] or potential[x] - gains[k] != potential[y]:
+                        continue
+                    visited[v] = True
+                    if mate_right[v] == -1:
+                        if potential[y] == potential[sink]:
+                            # Flip the path, recovering the gain of each new matched edge
+                            for u in reversed(stack):
+                                gain = gains[position[u] - 1]
+                                mate_left[u], mate_right[v], v = v, u, mate_left[u]
+                                mate_gain[u] = gain
+                            break
+                    else:
+                        stack.append(mate_right[v])
 
     def hungarian_algorithm(self, cost):
         """
@@ -134,21 +394,26 @@ class Solver_Hungarian(Solver):
                 lowest = np.inf 
                 visited_rows[current_row] = True 
 
-                # Iterate over remaining columns to find the shortest path
-                for it in range(num_remaining):  # O(n)
-                    j = remaining[it]
-                    # Calculate the reduced cost for the current row and column
-                    r = min_value + cost[current_row, j] - u[current_row] - v[j]
-
-                    # Update the shortest path costs and path
-                    if r < shortest_path_costs[j]:
-                        path[j] = current_row
-                    shortest_path_costs[j] = min(shortest_path_costs[j], r)
-
-                    # Track the column with the lowest shortest path cost
-                    if (shortest_path_costs[j] < lowest) or (shortest_path_costs[j] == lowest and row_to_col[j] == -1):  # O(1)
-                        index = it
-                    lowest = min(lowest, shortest_path_costs[j])
+                # Reduced costs from the current row to all the remaining columns at once
+                columns = remaining[:num_remaining]
+                r = min_value + cost[current_row, columns] - u[current_row] - v[columns]  # O(n)
+
+                # Update the shortest path costs and path
+                costs = shortest_path_costs[columns]
+                improved = r < costs
+                path[columns[improved]] = current_row
+                costs = np.minimum(costs, r)
+                shortest_path_costs[columns] = costs
+
+                # Select the column with the lowest shortest path cost, preferring the last unassigned one among ties
+                if num_remaining:
+                    lowest = costs.min()
+                    ties = np.flatnonzero(costs == lowest)
+                    unassigned = ties[row_to_col[columns[ties]] == -1]
+                    if len(unassigned):
+                        index = unassigned[-1]
+                    elif lowest < np.inf:
+                        index = ties[0]
 
                 # Update min_value to the lowest shortest path cost found
                 min_value = lowest  
@@ -200,5 +465,6 @@ class Solver_Hungarian(Solver):
         return np.arange(n), col_to_row  # O(n)
 
 # Overall Complexity:
-# The overall time complexity is dominated by the Hungarian algorithm, which is O(n^3).
+# Original rules: the sparse assignment only stores the P grid edges, O(K * P log P) time and O(P) space.
+# New rules: the time complexity is dominated by the Hungarian algorithm, which is O(n^3).
 # The space complexity is O(n^2) due to the storage of the cost matrix and additional arrays.
@@ -0,0 +1,136 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class Solver_ProfileDP(Solver):
+    """
+    An exact solver for the original rules on narrow grids, by broken-profile dynamic programming.
+
+    Under the original rules only adjacent cells pair, so the cells are scanned row by row along
+    the longest dimension while a bitmask (the profile) records which cells of the frontier are
+    already covered by a vertical pair. The optimum is exact, in O(n*m * 2^w) time with
+    w = min(n, m), the transitions of each cell being vectorized over all the profiles.
+
+    Attributes
+    ----------
+    max_width : int
+        The largest min(n, m) for which the solver is chosen automatically (see `applies`).
+    """
+
+    max_width = 8
+
+    @classmethod
+    def applies(cls, grid: Grid, rules: str = "original rules") -> bool:
+        """
+        Tells whether the profile DP should be preferred for a grid.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid to be solved.
+        rules : str, optional
+            The rules used. Default is "original rules".
+
+        Returns
+        -------
+        bool
+            True under the original rules when min(n, m) <= max_width.
+        """
+        return rules == "original rules" and min(grid.n, grid.m) <= cls.max_width
+
+    def run(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Runs the broken-profile dynamic programming to find optimal pairs of cells.
+
+        Returns
+        -------
+        list of tuple
+            A list of pairs of cells, each represented as a tuple of tuples.
+
+        Raises
+        ------
+        ValueError
+            If the solver is not used with the original rules.
+
+        Complexity : O(n*m * 2^min(n, m))
+        """
+        if self.rules != "original rules":
+            raise ValueError("Solver_ProfileDP only applies to the original rules.")
+
+        n, m = self.grid.n, self.grid.m
+        _, value = self.grid.to_arrays()
+        src, dst, cost = self.grid.edges(self.rules)
+        gain = value.ravel().astype(np.int64)[src] + value.ravel().astype(np.int64)[dst] - cost
+
+        # Gains of the pairs to the right and down, -1 where the pair is not allowed
+        right = np.full((n, m), -1, dtype=np.int64)
+        down = np.full((n, m), -1, dtype=np.int64)
+        horizontal = (dst == src + 1) & (src % m != m - 1)
+        right.ravel()[src[horizontal]] = gain[horizontal]
+        down.ravel()[src[~horizontal]] = gain[~horizontal]
+
+        # Scan along the longest dimension, the profile spanning the shortest one
+        transposed = m > n
+        if transposed:
+            n, m = m, n
+            right, down = down.T, right.T
+
+        size = 1 << m
+        masks = np.arange(size)
+        unreachable = np.iinfo(np.int64).min // 2
+        best = np.full(size, unreachable, dtype=np.int64)
+        best[0] = 0
+        choices = np.zeros((n * m, size), dtype=np.int8)
+
+        # Per column j: the profiles where the cell is free, and those where the right cell is covered
+        free = [masks[(masks >> j) & 1 == 0] for j in range(m)]
+        right_covered = [masks[((masks >> j) & 3) == 2] for j in range(m - 1)] + [None]
+
+        for i in range(n):
+            for j in range(m):
+                bit = 1 << j
+                free_j = free[j]
+                covered_j = free_j | bit
+                new = np.empty(size, dtype=np.int64)
+                choice = np.zeros(size, dtype=np.int8)
+                # 0: covered from above, 1: left unpaired, 2: paired to the right, 3: paired down
+                from_covered = best[covered_j]
+                from_free = best[free_j]
+                new[free_j] = np.maximum(from_covered, from_free)
+                choice[free_j] = from_free > from_covered
+                if right[i, j] >= 0:
+                    targets = right_covered[j]
+                    candidate = best[targets ^ (bit << 1)] + right[i, j]
+                    better = candidate > new[targets]
+                    new[targets[better]] = candidate[better]
+                    choice[targets[better]] = 2
+                if down[i, j] >= 0:
+                    new[covered_j] = from_free + down[i, j]
+                    choice[covered_j] = 3
+                else:
+                    new[covered_j] = unreachable
+                choices[i * m + j] = choice
+                best = new
+
+        # Walk back through the choices from the empty profile
+        self.pairs = []
+        mask = 0
+        for p in range(n * m - 1, -1, -1):
+            i, j = divmod(p, m)
+            bit = 1 << j
+            choice = choices[p, mask]
+            if choice == 0:
+                mask |= bit
+            elif choice == 2:
+                mask ^= 1 << (j + 1)
+                self.pairs.append(((i, j), (i, j + 1)))
+            elif choice == 3:
+                mask ^= bit
+                self.pairs.append(((i, j), (i + 1, j)))
+        self.pairs.reverse()
+
+        if transposed:
+            self.pairs = [((j1, i1), (j2, i2)) for (i1, j1), (i2, j2) in self.pairs]
+        return self.pairs
@@ -0,0 +1,189 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class Solver_Wildcard(Solver):
+    """
+    A solver for the new rules that exploits the white-cell wildcard structure.
+
+    Under the new rules a white cell pairs with every non-black cell, while the other
+    colors only pair with adjacent cells. Pairing cells u and v lowers the score by
+    2 * min(value_u, value_v), which splits over the value thresholds t:
+    2 * sum_t [value_u >= t][value_v >= t]. Above each threshold the maximum number
+    of pairs is known exactly: a maximum matching of the colored cells on their
+    (bipartite) adjacency graph, completed by the white cells.
+
+    The solver builds the colored matching threshold by threshold (highest values first),
+    then pairs the remaining cells with white cells by decreasing value. The threshold
+    decomposition also gives a lower bound on the optimal score.
+
+    Attributes
+    ----------
+    lower_bound : int
+        A lower bound on the optimal score. The pairs found are optimal whenever
+        `score()` equals `lower_bound`, which is always the case on grids whose
+        values are all equal.
+    """
+
+    def run(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """
+        Runs the wildcard matching to find pairs of cells.
+
+        Returns
+        -------
+        list of tuple
+            A list of pairs of cells, each represented as a tuple of tuples.
+
+        Raises
+        ------
+        ValueError
+            If the solver is not used with the new rules.
+
+        Complexity : O(L * n*m * sqrt(n*m)) in practice, L being the number of distinct values
+        """
+        if self.rules != "new rules":
+            raise ValueError("Solver_Wildcard only applies to the new rules.")
+
+        pair_set = PairSet(self.grid, self.rules)
+        _, value = self.grid.to_arrays()
+        value = value.ravel().astype(np.int64)
+        is_white = np.zeros(len(value), dtype=bool)
+        is_white[pair_set.whites] = True
+
+        # Adjacency between colored cells, from even cells (i + j even) to odd cells
+        src, dst = pair_set.adjacent_src, pair_set.adjacent_dst
+        colored_pair = ~is_white[dst]
+        src, dst = src[colored_pair], dst[colored_pair]
+        src_rows, src_cols = divmod(src, self.grid.m)
+        src_is_even = (src_rows + src_cols) % 2 == 0
+        even = np.where(src_is_even, src, dst)
+        odd = np.where(src_is_even, dst, src)
+        order = np.argsort(even, kind="stable")
+        adjacency = odd[order].tolist()
+        pointers = np.searchsorted(even[order], np.arange(len(value) + 1)).tolist()
+
+        values = value.tolist()
+        mate = [-1] * len(value)
+        maximum_mate = [-1] * len(value)
+        active = [False] * len(value)
+        levels = np.unique(value[pair_set.playable])[::-1].tolist()
+        cells_by_value = {}
+        for x in pair_set.playable.tolist():
+            cells_by_value.setdefault(values[x], []).append(x)
+
+        # Threshold by threshold, extend a maximum colored matching for the bound and the
+        # colored matching of the solution, which only grows while white cells are lacking
+        gain_bound = 0
+        matched = maximum_matched = whites = colored = 0
+        even_cells = []
+        for k, t in enumerate(levels):
+            for x in cells_by_value[t]:
+                if is_white[x]:
+                    whites += 1
+                    continue
+                active[x] = True
+                colored += 1
+                i, j = divmod(x, self.grid.m)
+                if (i + j) % 2 == 0:
+                    even_cells.append(x)
+            maximum_matched += self.augment(even_cells, adjacency, pointers, maximum_mate, active)
+            free_colored = colored - 2 * maximum_matched
+            max_pairs = maximum_matched + min(whites, free_colored) + max(0, whites - free_colored) // 2
+            # A colored pair only adds a pair at this threshold if two colored cells would stay unpaired
+            lacking = (colored - 2 * matched - whites) // 2
+            if lacking > 0:
+                matched += self.augment(even_cells, adjacency, pointers, mate, active, lacking)
+            next_t = levels[k + 1] if k + 1 < len(levels) else 0
+            gain_bound += 2 * (t - next_t) * max_pairs
+
+        self.pairs = []
+        cells = self.grid.cells(np.arange(len(value)))
+        for x in even_cells:
+            if mate[x] != -1:
+                self.pairs.append((cells[x], cells[mate[x]]))
+
+        # Pair the remaining cells by decreasing value, colored cells first taking a white cell
+        remaining = [x for x in pair_set.playable.tolist() if is_white[x] or mate[x] == -1]
+        remaining.sort(key=lambda x: -values[x])
+        open_whites = []
+        open_colored = []
+        for x in remaining:
+            if is_white[x]:
+                if open_colored:
+                    self.pairs.append((cells[open_colored.pop()], cells[x]))
+                else:
+                    open_whites.append(x)
+            elif open_whites:
+                self.pairs.append((cells[open_whites.pop()], cells[x]))
+            else:
+                open_colored.append(x)
+        for w1, w2 in zip(open_whites[0::2], open_whites[1::2]):
+            self.pairs.append((cells[w1], cells[w2]))
+
+        self.lower_bound = int(value[pair_set.playable].sum()) - gain_bound
+        return self.pairs
+
+    @staticmethod
+    def augment(even_cells: list[int], adjacency: list[int], pointers: list[int], mate: list[int], active: list[bool],
+                limit: int = None) -> int:
+        """
+        Extends a bipartite matching with augmenting paths, up to a maximum one.
+
+        Only the active cells are considered, and cells already matched stay matched.
+
+        Parameters
+        ----------
+        even_cells : list[int]
+            The active cells of the left side of the bipartite graph.
+        adjacency : list[int]
+            Neighbours of the left cells, the neighbours of u being
+            `adjacency[pointers[u]:pointers[u + 1]]`.
+        pointers : list[int]
+            Offsets of each cell in `adjacency`.
+        mate : list[int]
+            The current matching, `mate[u]` being the cell matched with u or -1. Updated in place.
+        active : list[bool]
+            Whether each cell can be used.
+        limit : int, optional
+            The maximum number of augmenting paths to apply. Default is None (no limit).
+
+        Returns
+        -------
+        int
+            The number of augmenting paths applied.
+        """
+        augmented = 0
+        progress = True
+        while progress and augmented != limit:
+            progress = False
+            visited = set()
+            for root in even_cells:
+                if augmented == limit:
+                    break
+                if mate[root] != -1:
+                    continue
+                # Iterative depth-first search for an augmenting path starting at root
+                stack = [(root, pointers[root])]
+                visited.add(root)
+                while stack:
+                    u, k = stack[-1]
+                    if k == pointers[u + 1]:
+                        stack.pop()
+                        continue
+                    stack[-1] = (u, k + 1)
+                    v = adjacency[k]
+                    if not active[v] or v in visited:
+                        continue
+                    visited.add(v)
+                    if mate[v] == -1:
+                        # Flip the path
+                        for w, _ in reversed(stack):
+                            mate[v], mate[w], v = w, v, mate[w]
+                        augmented += 1
+                        progress = True
+                        break
+                    visited.add(mate[v])
+                    stack.append((mate[v], pointers[mate[v]]))
+        return augmented
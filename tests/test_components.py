@@ -0,0 +1,48 @@
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class TestComponents(unittest.TestCase):
+
+    def test_labels(self):
+        grid = Grid(2, 3, [[0, 4, 1], [0, 4, 2]], [[1, 1, 1], [1, 1, 1]])
+        labels = PairSet(grid, "original rules").components()
+        self.assertEqual(labels.tolist(), [0, -1, 1, 0, -1, 1])
+        labels = PairSet(grid, "new rules").components()
+        self.assertEqual(labels.tolist(), [0, -1, 0, 0, -1, 0])
+
+    def test_same_score(self):
+        for file_name in ["grid05.in", "grid15.in", "grid18.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            for solver_class in [Solver_Hungarian, Solver_Blossom]:
+                solver = solver_class(grid)
+                solver.run()
+                decomposed = solver_class(grid)
+                pairs = decomposed.run_by_components(max_workers=1)
+                self.assertEqual(decomposed.pairs, pairs)
+                self.assertEqual(decomposed.score(), solver.score())
+
+    def test_process_pool(self):
+        grid = Grid.grid_from_file("input/grid15.in", read_values=True)
+        solver = Solver_Hungarian(grid)
+        solver.run()
+        decomposed = Solver_Hungarian(grid)
+        pairs = decomposed.run_by_components(max_workers=2, parallel_size=10)
+        allowed = set(grid.all_pairs())
+        for (cell1, cell2) in pairs:
+            self.assertTrue((cell1, cell2) in allowed or (cell2, cell1) in allowed)
+        self.assertEqual(decomposed.score(), solver.score())
+
+    def test_run_arguments(self):
+        grid = Grid.grid_from_file("input/grid05.in", read_values=True)
+        solver = Solver_Ford_Fulkerson(grid)
+        pairs = solver.run_by_components(max_workers=1, method="hopcroft_karp")
+        self.assertEqual(len(pairs), len(Solver_Ford_Fulkerson(grid).run()))
+        for (cell1, cell2) in pairs:
+            self.assertEqual(sum(cell1) % 2, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+import unittest
+
+class TestEdges(unittest.TestCase):
+
+    def test_edges_match_all_pairs(self):
+        for file_name in ["input/grid00.in", "input/grid01.in", "input/grid05.in", "input/grid13.in"]:
+            for backend in Grid.backends:
+                grid = Grid.grid_from_file(file_name, read_values=True, backend=backend)
+                for rules in ["original rules", "new rules"]:
+                    src, dst, cost = grid.edges(rules)
+                    pairs = grid.all_pairs(rules)
+                    self.assertEqual(list(zip(grid.cells(src), grid.cells(dst))), pairs)
+                    self.assertEqual(cost.tolist(), [grid.cost(pair) for pair in pairs])
+
+    def test_cell_ids(self):
+        grid = Grid.grid_from_file("input/grid05.in", read_values=True)
+        src, dst, _ = grid.edges()
+        self.assertEqual(src.dtype, np.int64)
+        self.assertEqual(grid.cells(src[:2]), [(0, 0), (0, 2)])
+        self.assertEqual(grid.cells(dst[:2]), [(1, 0), (0, 3)])
+
+    def test_unknown_rules(self):
+        grid = Grid.grid_from_file("input/grid00.in", read_values=True)
+        with self.assertRaises(ValueError):
+            grid.edges("other rules")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import sys
+import os
+import unittest
+import itertools
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class TestHungarianAlgorithm(unittest.TestCase):
+
+    def test_optimal_assignment(self):
+        rng = np.random.default_rng(0)
+        solver = Solver_Hungarian(None)
+        for n in range(1, 7):
+            for _ in range(5):
+                cost = rng.integers(-9, 1, (n, n)).astype(float)
+                rows, cols = solver.hungarian_algorithm(cost)
+                self.assertEqual(sorted(cols.tolist()), list(range(n)))
+                best = min(sum(cost[i, p[i]] for i in range(n)) for p in itertools.permutations(range(n)))
+                self.assertEqual(cost[rows, cols].sum(), best)
+
+    def test_new_rules_grid(self):
+        grid = Grid.grid_from_file("input/grid17.in", read_values=True)
+        pairs = Solver_Hungarian(grid, "new rules").run()
+        allowed = PairSet(grid, "new rules")
+        for (cell1, cell2) in pairs:
+            self.assertTrue((cell1, cell2) in allowed or (cell2, cell1) in allowed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import sys
+import os
+import unittest
+import random
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class TestIncremental(unittest.TestCase):
+
+    def fresh_score(self, grid, solver):
+        color = [row.copy() for row in grid.color]
+        for (i, j) in solver.removed:
+            color[i][j] = 4
+        remaining = Solver_Blossom(Grid(grid.n, grid.m, color, [row.copy() for row in grid.value]))
+        remaining.pairs = solver.fixed_pairs + remaining.run()
+        remaining.grid = grid
+        return remaining.score()
+
+    def test_hungarian_warm_start(self):
+        random.seed(0)
+        for file_name in ["grid05.in", "grid17.in", "grid19.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            solver = Solver_Hungarian(grid)
+            solver.run()
+            pairs = grid.all_pairs()
+            for _ in range(10):
+                available = [pair for pair in pairs if pair[0] not in solver.removed and pair[1] not in solver.removed]
+                if not available:
+                    break
+                solver.add_pair_constraint(random.choice(available))
+                solver.remove_cells([(random.randrange(grid.n), random.randrange(grid.m))])
+                cells = [cell for pair in solver.pairs for cell in pair]
+                self.assertEqual(len(cells), len(set(cells)))
+                self.assertEqual(solver.score(), self.fresh_score(grid, solver))
+
+    def test_default_resolve(self):
+        grid = Grid.grid_from_file("input/grid05.in", read_values=True)
+        solver = Solver_Blossom(grid)
+        solver.run()
+        pair = solver.pairs[0]
+        pairs = solver.add_pair_constraint(pair)
+        self.assertEqual(pairs[0], pair)
+        self.assertEqual(solver.fixed_pairs, [pair])
+        self.assertEqual(solver.removed, set(pair))
+        self.assertEqual(solver.score(), self.fresh_score(grid, solver))
+
+    def test_invalid_pair(self):
+        grid = Grid.grid_from_file("input/grid00.in", read_values=True)
+        solver = Solver_Hungarian(grid)
+        solver.run()
+        with self.assertRaises(ValueError):
+            solver.add_pair_constraint(((0, 0), (1, 1)))
+        solver.add_pair_constraint(((0, 0), (0, 1)))
+        with self.assertRaises(ValueError):
+            solver.add_pair_constraint(((0, 1), (1, 1)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import os
+import random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+import unittest
+
+class Test_LegalMoves(unittest.TestCase):
+
+    def brute_force(self, grid, rules, used):
+        return any(pair[0] not in used and pair[1] not in used for pair in grid.all_pairs(rules))
+
+    def test_random_games(self):
+        random.seed(0)
+        for file_name in ["grid00.in", "grid01.in", "grid03.in", "grid05.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            for rules in ["original rules", "new rules"]:
+                legal_moves = LegalMoves(grid, rules)
+                played = []
+                used = set()
+                while True:
+                    self.assertEqual(bool(legal_moves), self.brute_force(grid, rules, used))
+                    available = [pair for pair in grid.all_pairs(rules) if pair[0] not in used and pair[1] not in used]
+                    if not available:
+                        break
+                    pair = random.choice(available)
+                    legal_moves.play(pair)
+                    played.append(pair)
+                    used.update(pair)
+                    self.assertFalse(legal_moves.is_free(pair[0]))
+                    if len(played) % 3 == 0:
+                        pair = played.pop(random.randrange(len(played)))
+                        legal_moves.take_back(pair)
+                        used.difference_update(pair)
+                        self.assertTrue(legal_moves.is_free(pair[1]))
+                legal_moves.reset()
+                self.assertEqual(bool(legal_moves), self.brute_force(grid, rules, set()))
+
+    def test_blocked_grid(self):
+        grid = Grid(2, 2, [[4, 1], [3, 4]])
+        self.assertFalse(LegalMoves(grid))
+        self.assertFalse(LegalMoves(grid, "new rules"))
+
+if __name__ == '__main__':
+    unittest.main()
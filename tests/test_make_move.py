@@ -0,0 +1,45 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+import unittest
+
+class Test_make_move(unittest.TestCase):
+
+    def test_make_unmake(self):
+        grid = Grid.grid_from_file("input/grid05.in", read_values=True)
+        color = [row.copy() for row in grid.color]
+        zobrist = grid.zobrist
+        pairs = grid.all_pairs()
+        grid.make_move(pairs[0], 1)
+        self.assertTrue(grid.is_forbidden(*pairs[0][0]))
+        self.assertTrue(grid.is_forbidden(*pairs[0][1]))
+        self.assertNotIn(pairs[0], grid.all_pairs())
+        self.assertEqual(grid.zobrist, grid.rehash())
+        self.assertEqual(grid.unmake_move(), pairs[0])
+        self.assertEqual(grid.color, color)
+        self.assertEqual(grid.zobrist, zobrist)
+        self.assertEqual(grid.paired_by, {})
+
+    def test_overlapping_move(self):
+        grid = Grid.grid_from_file("input/grid00.in", read_values=True)
+        grid.make_move(((0, 0), (0, 1)))
+        with self.assertRaises(ValueError):
+            grid.make_move(((0, 1), (0, 2)))
+        with self.assertRaises(ValueError):
+            grid.make_move(((1, 0), (0, 0)))
+        self.assertEqual(len(grid.moves), 1)
+        grid.unmake_move()
+        with self.assertRaises(IndexError):
+            grid.unmake_move()
+
+    def test_bot_leaves_grid_unchanged(self):
+        grid = Grid.grid_from_file("input/grid03.in", read_values=True)
+        color = [row.copy() for row in grid.color]
+        Minimax_Bot.move_to_play2(grid, "original rules")
+        self.assertEqual(grid.color, color)
+        self.assertEqual(grid.moves, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+import unittest
+
+class TestNumpyBackend(unittest.TestCase):
+
+    def test_constructor_dtypes(self):
+        grid = Grid(2, 2, [[0, 1], [2, 3]], [[5, 6], [7, 8]], backend="numpy")
+        self.assertEqual(grid.color.dtype, np.int8)
+        self.assertEqual(grid.value.dtype, np.int32)
+        self.assertEqual(grid.color.tolist(), [[0, 1], [2, 3]])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            Grid(2, 2, backend="dict")
+
+    def test_str_representation(self):
+        grid = Grid.grid_from_file("input/grid00.in", read_values=True)
+        grid_np = Grid.grid_from_file("input/grid00.in", read_values=True, backend="numpy")
+        self.assertEqual(str(grid_np), str(grid))
+
+    def test_all_pairs_matches_list_backend(self):
+        for file_name in ["input/grid00.in", "input/grid01.in", "input/grid05.in", "input/grid13.in"]:
+            grid = Grid.grid_from_file(file_name, read_values=True)
+            grid_np = Grid.grid_from_file(file_name, read_values=True, backend="numpy")
+            for rules in ["original rules", "new rules"]:
+                self.assertEqual(grid_np.all_pairs(rules), grid.all_pairs(rules))
+
+    def test_costs(self):
+        grid = Grid.grid_from_file("input/grid01.in", read_values=True, backend="numpy")
+        pairs = [((0, 0), (1, 0)), ((1, 1), (1, 2))]
+        self.assertEqual(grid.costs(pairs).tolist(), [grid.cost(pair) for pair in pairs])
+        self.assertIsInstance(grid.cost(pairs[0]), int)
+
+    def test_score(self):
+        grid = Grid.grid_from_file("input/grid01.in", read_values=True, backend="numpy")
+        solver = Solver(grid)
+        self.assertEqual(solver.score(), 24)
+        solver.pairs = [((0, 0), (1, 0)), ((1, 1), (1, 2))]
+        self.assertEqual(solver.score(), 12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+import unittest
+
+class TestPairSet(unittest.TestCase):
+
+    def test_matches_all_pairs(self):
+        for file_name in ["input/grid00.in", "input/grid01.in", "input/grid05.in", "input/grid13.in"]:
+            grid = Grid.grid_from_file(file_name, read_values=True)
+            for rules in ["original rules", "new rules"]:
+                pairs = grid.all_pairs(rules)
+                pair_set = PairSet(grid, rules)
+                self.assertEqual(len(pair_set), len(pairs))
+                self.assertEqual(list(pair_set), pairs)
+                self.assertEqual([pair for _, pair in pair_set.by_cost()], sorted(pairs, key=grid.cost))
+
+    def test_membership(self):
+        grid = Grid.grid_from_file("input/grid01.in", read_values=True)
+        pair_set = PairSet(grid, "new rules")
+        self.assertIn(((1, 2), (0, 0)), pair_set)    # white with a distant cell
+        self.assertIn(((1, 0), (1, 1)), pair_set)    # adjacent colored cells
+        self.assertNotIn(((0, 0), (0, 1)), pair_set) # black cell
+        self.assertNotIn(((1, 0), (0, 2)), pair_set) # distant colored cells
+        self.assertNotIn(((1, 2), (1, 2)), pair_set)
+        self.assertNotIn(((0, 0), (2, 0)), pair_set)
+        self.assertNotIn(((1, 2), (0, 0)), PairSet(grid, "original rules"))
+
+    def test_neighbours_and_degrees(self):
+        grid = Grid.grid_from_file("input/grid01.in", read_values=True)
+        pair_set = PairSet(grid, "new rules")
+        self.assertEqual(pair_set.neighbours((1, 2)), [(0, 0), (0, 2), (1, 0), (1, 1)])
+        self.assertEqual(pair_set.neighbours((1, 0)), [(0, 0), (1, 1), (1, 2)])
+        self.assertEqual(pair_set.neighbours((0, 1)), [])
+        self.assertEqual(pair_set.degrees().tolist(), [4, 0, 2, 3, 3, 4])
+        with self.assertRaises(IndexError):
+            pair_set.neighbours((2, 0))
+
+    def test_large_grid_new_rules(self):
+        grid = Grid.grid_from_file("input/grid21.in", read_values=True)
+        pair_set = PairSet(grid, "new rules")
+        whites, playable = len(pair_set.whites), len(pair_set.playable)
+        self.assertGreaterEqual(len(pair_set), whites * (playable - 1))
+        cost, pair = next(pair_set.by_cost())
+        self.assertIn(pair, pair_set)
+        self.assertEqual(cost, grid.cost(pair))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import sys
+import os
+import unittest
+import tempfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class TestSolutionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_hit(self):
+        cache = SolutionCache(self.directory.name)
+        grid = Grid.grid_from_file("input/grid05.in", read_values=True)
+        solver = Solver_Hungarian(grid)
+        pairs = cache.run(solver)
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+
+        cached = Solver_Hungarian(grid)
+        cached.run = None  # a hit must not run the solver
+        self.assertEqual(cache.run(cached), pairs)
+        self.assertEqual(cached.score(), solver.score())
+
+    def test_key(self):
+        grid = Grid.grid_from_file("input/grid05.in", read_values=True)
+        key = SolutionCache.key(grid, "original rules", "Solver_Hungarian")
+        same = Grid.grid_from_file("input/grid05.in", read_values=True)
+        self.assertEqual(key, SolutionCache.key(same, "original rules", "Solver_Hungarian"))
+        self.assertNotEqual(key, SolutionCache.key(grid, "new rules", "Solver_Hungarian"))
+        self.assertNotEqual(key, SolutionCache.key(grid, "original rules", "Solver_Blossom"))
+        self.assertNotEqual(key, SolutionCache.key(grid, "original rules", "Solver_Hungarian", method="x"))
+        grid.value[0][0] += 1
+        self.assertNotEqual(key, SolutionCache.key(grid, "original rules", "Solver_Hungarian"))
+
+    def test_eviction(self):
+        cache = SolutionCache(self.directory.name, max_entries=2)
+        for index in range(3):
+            cache.put(str(index), [((0, index), (0, index + 1))])
+            os.utime(os.path.join(self.directory.name, f"{index}.json"), (index, index))
+        # Entry 0 was evicted; using entry 1 makes entry 2 the least recently used
+        self.assertEqual(cache.get("1"), [((0, 1), (0, 2))])
+        cache.put("3", [])
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["1.json", "3.json"])
+        self.assertIsNone(cache.get("2"))
+
+    def test_size_cap(self):
+        cache = SolutionCache(self.directory.name, max_bytes=0)
+        cache.put("0", [((0, 0), (0, 1))])
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+if __name__ == '__main__':
+    unittest.main()
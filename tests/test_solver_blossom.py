@@ -66,5 +66,33 @@ class TestSolverBlossom(unittest.TestCase):
         pairs = solver.run()
         self.assertEqual(pairs, [])
 
+    def test_max_weight_matching(self):
+        # Triangle 0-1-2 with a pendant vertex 3: the odd cycle needs a blossom
+        edges = [(0, 1, 6), (1, 2, 6), (0, 2, 5), (2, 3, 4)]
+        mate = Solver_Blossom.max_weight_matching(edges, 4, verify_optimum=True)
+        self.assertEqual(mate, [1, 0, 3, 2])
+        self.assertEqual(Solver_Blossom.max_weight_matching([], 2), [-1, -1])
+
+    def test_matches_networkx(self):
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            n = int(rng.integers(2, 12))
+            G = nx.gnp_random_graph(n, 0.4, seed=int(rng.integers(1000)))
+            edges = [(i, j, int(rng.integers(1, 10))) for i, j in G.edges()]
+            G.add_weighted_edges_from(edges)
+            mate = Solver_Blossom.max_weight_matching(edges, n, verify_optimum=True)
+            weight = sum(G[v][w]["weight"] for v, w in enumerate(mate) if v < w)
+            expected = sum(G[v][w]["weight"] for v, w in nx.max_weight_matching(G))
+            self.assertEqual(weight, expected)
+
+    def test_grid_scores(self):
+        for file_name in ["grid05.in", "grid17.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            solver = Solver_Blossom(grid, "original rules")
+            solver.run(verify_optimum=True)
+            hungarian = Solver_Hungarian(grid, "original rules")
+            hungarian.run()
+            self.assertEqual(solver.score(), hungarian.score())
+
 if __name__ == '__main__':
     unittest.main()
@@ -28,5 +28,28 @@ class TestSolverFordFulkersonRun(unittest.TestCase):
         expected_pairs = [((0, 2), (1, 2)), ((1, 1), (1, 0))] #Calculated by hand
         self.assertEqual(sorted(pairs), sorted(expected_pairs))
 
+    def test_hopcroft_karp_run(self):
+        for file_name in ["grid00.in", "grid01.in", "grid05.in", "grid15.in", "grid18.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            pairs = Solver_Ford_Fulkerson(grid).run("hopcroft_karp")
+            expected_pairs = Solver_Ford_Fulkerson(grid).run()
+            self.assertEqual(len(pairs), len(expected_pairs))
+            cells = [cell for pair in pairs for cell in pair]
+            self.assertEqual(len(cells), len(set(cells)))
+            allowed = set(grid.all_pairs())
+            for (cell1, cell2) in pairs:
+                self.assertEqual(sum(cell1) % 2, 0)
+                self.assertTrue((cell1, cell2) in allowed or (cell2, cell1) in allowed)
+
+    def test_hopcroft_karp_matching(self):
+        # Left 0 - right {0, 1}, left 1 - right {0}, left 2 - right {1, 2}
+        mate = Solver_Ford_Fulkerson.hopcroft_karp([0, 1, 0, 1, 2], [0, 2, 3, 5], 3)
+        self.assertEqual(mate, [1, 0, 2])
+
+    def test_unknown_method(self):
+        grid = Grid.grid_from_file("input/grid00.in")
+        with self.assertRaises(ValueError):
+            Solver_Ford_Fulkerson(grid).run("dinic")
+
 if __name__ == '__main__':
     unittest.main()
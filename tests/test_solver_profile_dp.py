@@ -0,0 +1,40 @@
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class TestSolverProfileDP(unittest.TestCase):
+
+    def test_matches_hungarian(self):
+        for file_name in ["grid00.in", "grid01.in", "grid02.in", "grid05.in", "grid13.in", "grid18.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            solver = Solver_ProfileDP(grid)
+            pairs = solver.run()
+            cells = [cell for pair in pairs for cell in pair]
+            self.assertEqual(len(cells), len(set(cells)))
+            allowed = set(grid.all_pairs())
+            for pair in pairs:
+                self.assertIn(pair, allowed)
+            hungarian = Solver_Hungarian(grid)
+            hungarian.run()
+            self.assertEqual(solver.score(), hungarian.score())
+
+    def test_strips(self):
+        # A single column and a single row: the same strip scanned in both orientations
+        column = Grid(5, 1, [[1], [2], [0], [3], [4]], [[1], [5], [5], [2], [2]])
+        row = Grid(1, 5, [[1, 2, 0, 3, 4]], [[1, 5, 5, 2, 2]])
+        self.assertEqual(Solver_ProfileDP(column).run(), [((1, 0), (2, 0))])
+        self.assertEqual(Solver_ProfileDP(row).run(), [((0, 1), (0, 2))])
+
+    def test_applies(self):
+        grid = Grid.grid_from_file("input/grid05.in", read_values=True)
+        self.assertTrue(Solver_ProfileDP.applies(grid, "original rules"))
+        self.assertFalse(Solver_ProfileDP.applies(grid, "new rules"))
+        self.assertFalse(Solver_ProfileDP.applies(Grid.grid_from_file("input/grid21.in"), "original rules"))
+        with self.assertRaises(ValueError):
+            Solver_ProfileDP(grid, "new rules").run()
+
+if __name__ == '__main__':
+    unittest.main()
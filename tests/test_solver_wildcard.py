@@ -0,0 +1,52 @@
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class TestSolverWildcard(unittest.TestCase):
+
+    def check_pairs(self, grid, pairs):
+        pair_set = PairSet(grid, "new rules")
+        cells = [cell for pair in pairs for cell in pair]
+        self.assertEqual(len(cells), len(set(cells)))
+        for pair in pairs:
+            self.assertTrue(pair in pair_set or (pair[1], pair[0]) in pair_set)
+
+    def test_matches_blossom(self):
+        for file_name in ["grid00.in", "grid01.in", "grid02.in", "grid14.in", "grid17.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            solver = Solver_Wildcard(grid, "new rules")
+            pairs = solver.run()
+            self.check_pairs(grid, pairs)
+            blossom = Solver_Blossom(grid, "new rules")
+            blossom.run()
+            self.assertEqual(solver.score(), blossom.score())
+            self.assertEqual(solver.lower_bound, solver.score())
+
+    def test_lower_bound(self):
+        for file_name in ["grid05.in", "grid18.in", "grid19.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            solver = Solver_Wildcard(grid, "new rules")
+            pairs = solver.run()
+            self.check_pairs(grid, pairs)
+            blossom = Solver_Blossom(grid, "new rules")
+            blossom.run()
+            self.assertLessEqual(solver.lower_bound, blossom.score())
+            self.assertLessEqual(blossom.score(), solver.score())
+
+    def test_unit_values_are_optimal(self):
+        grid = Grid.grid_from_file("input/grid21.in", read_values=True)
+        solver = Solver_Wildcard(grid, "new rules")
+        pairs = solver.run()
+        self.check_pairs(grid, pairs)
+        self.assertEqual(solver.score(), solver.lower_bound)
+
+    def test_original_rules(self):
+        grid = Grid.grid_from_file("input/grid00.in", read_values=True)
+        with self.assertRaises(ValueError):
+            Solver_Wildcard(grid, "original rules").run()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from color_grid_game import *
+
+class TestSparseAssignment(unittest.TestCase):
+
+    def test_assignment(self):
+        # Left 0 - right {0: 5, 1: 4}, left 1 - right {0: 4}: taking the edge of weight 5 alone is worse
+        mate = Solver_Hungarian.sparse_assignment([0, 1, 0], [0, 2, 3], [5, 4, 4], 2)
+        self.assertEqual(mate, [1, 0])
+
+    def test_assignment_not_perfect(self):
+        mate = Solver_Hungarian.sparse_assignment([0, 0], [0, 1, 2], [3, 1], 1)
+        self.assertEqual(mate, [0, -1])
+
+    def test_matches_blossom(self):
+        for file_name in ["grid00.in", "grid01.in", "grid05.in", "grid13.in", "grid18.in"]:
+            grid = Grid.grid_from_file(os.path.join("input", file_name), read_values=True)
+            solver = Solver_Hungarian(grid, "original rules")
+            pairs = solver.run()
+            cells = [cell for pair in pairs for cell in pair]
+            self.assertEqual(len(cells), len(set(cells)))
+            allowed = set(grid.all_pairs())
+            for (cell1, cell2) in pairs:
+                self.assertTrue((cell1, cell2) in allowed or (cell2, cell1) in allowed)
+            blossom = Solver_Blossom(grid, "original rules")
+            blossom.run()
+            self.assertEqual(solver.score(), blossom.score())
+
+if __name__ == '__main__':
+    unittest.main()
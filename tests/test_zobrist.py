@@ -0,0 +1,42 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from color_grid_game import *
+import unittest
+
+class Test_zobrist(unittest.TestCase):
+
+    def test_same_content(self):
+        grid1 = Grid.grid_from_file("input/grid05.in", read_values=True)
+        grid2 = Grid.grid_from_file("input/grid05.in", read_values=True, backend="numpy")
+        self.assertEqual(grid1.zobrist, grid2.zobrist)
+        grid2.color[0][0] = (grid2.color[0][0] + 1) % 5
+        self.assertNotEqual(grid1.zobrist, grid2.rehash())
+
+    def test_block_cell(self):
+        grid = Grid.grid_from_file("input/grid05.in", read_values=True)
+        before = grid.zobrist
+        grid.block_cell(0, 0, 1)
+        grid.block_cell(0, 1, 1)
+        self.assertEqual(grid.color[0][0], 4)
+        self.assertNotEqual(grid.zobrist, before)
+        self.assertEqual(grid.zobrist, grid.rehash())
+        with self.assertRaises(ValueError):
+            grid.block_cell(0, 0, 2)
+
+    def test_order_and_player(self):
+        grid1 = Grid.grid_from_file("input/grid05.in", read_values=True)
+        grid2 = Grid.grid_from_file("input/grid05.in", read_values=True)
+        grid3 = Grid.grid_from_file("input/grid05.in", read_values=True)
+        grid1.block_cell(0, 0, 1)
+        grid1.block_cell(1, 0, 2)
+        grid2.block_cell(1, 0, 2)
+        grid2.block_cell(0, 0, 1)
+        grid3.block_cell(0, 0, 2)
+        grid3.block_cell(1, 0, 1)
+        self.assertEqual(grid1.zobrist, grid2.zobrist)
+        self.assertNotEqual(grid1.zobrist, grid3.zobrist)
+
+if __name__ == '__main__':
+    unittest.main()